@@ -0,0 +1,54 @@
+"""
+Shared concurrent runner for the project's test and validation scripts
+
+Each check prints its own progress; run_concurrently() runs the checks in
+parallel and hands back each one's output so the caller can replay it in order.
+"""
+
+import io
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Sequence, Tuple
+
+class ThreadLocalStdout:
+    """Send print output to the running check's own buffer so concurrent checks don't interleave"""
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def _target(self):
+        return getattr(self._local, 'buffer', None) or self._stream
+    
+    def write(self, text):
+        return self._target().write(text)
+    
+    def flush(self):
+        self._target().flush()
+    
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+def _safe_run(test: Callable[[], bool], stdout: ThreadLocalStdout) -> Tuple[bool, str]:
+    """Run one test with its output captured, returning (passed, output)"""
+    buffer = io.StringIO()
+    stdout._local.buffer = buffer
+    try:
+        passed = bool(test())
+    except Exception as e:
+        print(f"ERROR: Test error: {e}")
+        passed = False
+    finally:
+        stdout._local.buffer = None
+    return passed, buffer.getvalue()
+
+def run_concurrently(tests: Sequence[Callable[[], bool]]) -> List[Tuple[bool, str]]:
+    """Run independent tests in parallel, returning (passed, output) for each in order"""
+    original_stdout = sys.stdout
+    stdout = ThreadLocalStdout(original_stdout)
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=max(len(tests), 1)) as executor:
+            return list(executor.map(lambda test: _safe_run(test, stdout), tests))
+    finally:
+        sys.stdout = original_stdout
@@ -0,0 +1,13 @@
+"""
+Objects shared by the project's test scripts
+
+Callers put backend/ on sys.path before using these.
+"""
+
+from functools import lru_cache
+
+@lru_cache(maxsize=1)
+def get_processor():
+    """Shared LegalDataProcessor; it holds no per-dataset state"""
+    from app.utils.data_processor import LegalDataProcessor
+    return LegalDataProcessor()
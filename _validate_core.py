@@ -0,0 +1,535 @@
+"""
+Shared implementation of the project validation scripts
+
+validate_project.py, validate_project_clean.py and validate_project_simple.py
+are thin entry points that call run() with their output style.
+"""
+
+import os
+import sys
+import json
+import mmap
+import re
+import threading
+from functools import lru_cache, partial
+
+from _check_runner import run_concurrently
+
+# orjson (a backend dependency) serialises the summary much faster; fall back to json without it
+try:
+    import orjson
+    
+    def _dump_json(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _dump_json(obj):
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Status prefixes for each output style, looked up once per run
+_MARKERS = {
+    True: {
+        "start": "🚀 ", "check": "🔍 ", "ok": "✅ ", "error": "❌ ", "report": "📋 ",
+        "results": "📊 ", "done": "🎉 ", "next": "📝 ", "warn": "⚠️  "
+    },
+    False: {
+        "start": "", "check": "", "ok": "SUCCESS: ", "error": "ERROR: ", "report": "",
+        "results": "", "done": "SUCCESS: ", "next": "", "warn": "WARNING: "
+    }
+}
+
+# Absolute paths, resolved once at import (plain strings; they key the walk's read cache)
+_BASE = os.path.dirname(os.path.abspath(__file__))
+_BACKEND = os.path.join(_BASE, "backend")
+_APP = os.path.join(_BACKEND, "app")
+_MODELS = os.path.join(_APP, "models")
+_UTILS = os.path.join(_APP, "utils")
+_ROUTES = os.path.join(_APP, "routes")
+_REQUIREMENTS = os.path.join(_BACKEND, "requirements.txt")
+_IMPORTER = os.path.join(_UTILS, "huggingface_importer.py")
+_SUMMARY_PATH = os.path.join(_BASE, "project_summary.json")
+
+# Required layout and contents, built once at import
+
+_REQUIRED_DIRS = (
+    "backend",
+    "backend/app",
+    "backend/app/models",
+    "backend/app/routes",
+    "backend/app/utils",
+    "backend/app/auth",
+    "backend/app/database"
+)
+
+_REQUIRED_FILES = (
+    "backend/requirements.txt",
+    "backend/app/main.py",
+    "backend/app/config.py",
+    "backend/app/models/multi_model_trainer.py",
+    "backend/app/models/bart_trainer.py",
+    "backend/app/models/pegasus_trainer.py",
+    "backend/app/models/multilingual_trainer.py",
+    "backend/app/routes/training.py",
+    "backend/app/routes/datasets.py",
+    "backend/app/routes/inference.py",
+    "backend/app/utils/huggingface_importer.py",
+    "backend/app/utils/data_processor.py",
+    "backend/app/utils/model_manager.py"
+)
+
+_LEXSUM_PATTERNS = ('"multi_lexsum"', '"allenai/multi_lexsum"', '"v20220616"', 'summary/long')
+
+_TRAINERS = (
+    ("bart_trainer.py", "BARTTrainer"),
+    ("pegasus_trainer.py", "PEGASUSTrainer"),
+    ("multi_model_trainer.py", "MultiModelTrainer"),
+    ("multilingual_trainer.py", "MultilingualTrainer")
+)
+
+_UTILITIES = (
+    ("huggingface_importer.py", ("HuggingFaceDatasetImporter", "import_dataset", "_format_sample")),
+    ("data_processor.py", ("LegalDataProcessor", "process_dataset", "calculate_statistics")),
+    ("model_manager.py", ("ModelManager",)),
+    ("evaluator.py", ("ModelEvaluator",))
+)
+
+_REQUIRED_ROUTES = (
+    ("training.py", ("start_training", "get_training_jobs")),
+    ("datasets.py", ("import_hf_dataset", "get_available_hf_datasets")),
+    ("inference.py", ("generate_summary", "batch_generate_summary", "evaluate_model"))
+)
+
+_REQUIRED_PACKAGES = (
+    "transformers",
+    "datasets",
+    "torch",
+    "fastapi",
+    "sqlalchemy",
+    "pydantic",
+    "evaluate",
+    "rouge-score",
+    "nltk",
+    "langdetect"
+)
+
+# Files the content checks scan; the structure walk reads them as it lists their directory
+_CONTENT_FILES = frozenset(
+    [f"backend/app/models/{filename}" for filename, _ in _TRAINERS]
+    + [f"backend/app/utils/{filename}" for filename, _ in _UTILITIES]
+    + [f"backend/app/routes/{filename}" for filename, _ in _REQUIRED_ROUTES]
+    + ["backend/requirements.txt"]
+)
+
+# Directories the backend walk lists: only parents of a required or scanned path. Each
+# listing answers existence for all of its children, so leaf directories such as
+# backend/app/auth are never listed themselves
+_WALK_DIRS = frozenset(
+    os.path.dirname(path) for path in (*_REQUIRED_DIRS, *_REQUIRED_FILES, *_CONTENT_FILES)
+) - {""}
+
+def _map_file(path):
+    """Map a file read-only, so pattern searches run on the page cache without copying it"""
+    with open(path, 'rb') as f:
+        try:
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            return b""
+
+def _read_bytes(path):
+    """Return a file's contents (bytes or mmap), mapping each file at most once per run"""
+    # Every pattern is ASCII, so the raw bytes are searched without decoding them
+    contents = _backend_tree()[1]
+    with _TREE_LOCK:
+        # Files the walk didn't map are kept too, so a second check reuses the mapping;
+        # a failed open raises before anything is stored
+        if path not in contents:
+            contents[path] = _map_file(path)
+        return contents[path]
+
+@lru_cache(maxsize=None)
+def _pattern_regex(patterns):
+    """Encode a tuple of literal patterns and compile them into one alternation, once per pattern set"""
+    encoded = {pattern.encode('utf-8'): pattern for pattern in patterns}
+    # Lookahead alternation reports overlapping matches; longest patterns first
+    regex = re.compile(b"(?=(" + b"|".join(
+        re.escape(raw) for raw in sorted(encoded, key=len, reverse=True)
+    ) + b"))")
+    # Patterns that occur inside another one are present whenever the longer one is
+    contained = {raw: tuple(other for other in encoded if other != raw and other in raw) for raw in encoded}
+    return regex, encoded, contained
+
+def _find_patterns(content, patterns):
+    """Return the patterns present in the bytes content, found in a single pass over it"""
+    regex, encoded, contained = _pattern_regex(tuple(patterns))
+    if len(encoded) == 1:
+        # A lone pattern is a plain byte search, no regex machinery needed
+        (raw, pattern), = encoded.items()
+        return {pattern} if content.find(raw) != -1 else set()
+    
+    remaining = dict(encoded)
+    found = set()
+    for match in regex.finditer(content):
+        hit = match.group(1)
+        # A shorter pattern may hide behind a longer one starting at the same offset,
+        # and a found pattern settles every pattern it contains without searching for it
+        for raw in [raw for raw in remaining if hit.startswith(raw)]:
+            for covered in (raw, *contained[raw]):
+                pattern = remaining.pop(covered, None)
+                if pattern is not None:
+                    found.add(pattern)
+        if not remaining:
+            break
+    return found
+
+def _index_tree(root, prefix, descend, wanted_reads):
+    """Return the relative paths under root and the contents of wanted files, listing each directory once
+    
+    Only directories whose relative path is in descend are entered; the DirEntry type
+    reported by the directory listing is used, so no entry is stat'ed again. Files whose
+    relative path is in wanted_reads are mapped during the walk, keyed by their full path.
+    """
+    index = set()
+    contents = {}
+    stack = [(prefix, root)]
+    while stack:
+        rel, directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        index.add(rel)
+        with entries:
+            for entry in entries:
+                path = f"{rel}/{entry.name}" if rel else entry.name
+                index.add(path)
+                if path in descend and entry.is_dir(follow_symlinks=False):
+                    stack.append((path, entry.path))
+                elif path in wanted_reads and entry.is_file():
+                    contents[entry.path] = _map_file(entry.path)
+    return index, contents
+
+# The backend walk runs once per run() and is shared by every check
+_TREE = None
+_TREE_LOCK = threading.Lock()
+
+def _backend_tree():
+    """Return (index, contents) for backend/, walking it on first use"""
+    global _TREE
+    with _TREE_LOCK:
+        if _TREE is None:
+            _TREE = _index_tree(_BACKEND, "backend", _WALK_DIRS, _CONTENT_FILES)
+        return _TREE
+
+def _release_tree():
+    """Close the mappings made during a run and forget the walk, so the next run sees current files"""
+    global _TREE
+    with _TREE_LOCK:
+        if _TREE is not None:
+            for content in _TREE[1].values():
+                if isinstance(content, mmap.mmap):
+                    content.close()
+        _TREE = None
+
+def check_project_structure(mark):
+    """Check if all required files and directories exist"""
+    print(f"{mark['check']}Checking project structure...")
+    
+    # Every required path lives under backend/, so a single stat settles the missing-tree case
+    if not os.path.isdir(_BACKEND):
+        print(f"{mark['error']}Missing directories: {list(_REQUIRED_DIRS)}")
+        return False
+    
+    # One directory listing per parent directory instead of a stat per path
+    index, _ = _backend_tree()
+    
+    missing_dirs = [dir_path for dir_path in _REQUIRED_DIRS if dir_path not in index]
+    missing_files = [file_path for file_path in _REQUIRED_FILES if file_path not in index]
+    
+    if missing_dirs:
+        print(f"{mark['error']}Missing directories: {missing_dirs}")
+        return False
+    
+    if missing_files:
+        print(f"{mark['error']}Missing files: {missing_files}")
+        return False
+    
+    print(f"{mark['ok']}All required directories and files exist")
+    return True
+
+def check_multi_lexsum_integration(mark):
+    """Check if multi_lexsum dataset is properly integrated"""
+    print(f"\n{mark['check']}Checking multi_lexsum integration...")
+    
+    try:
+        # Check the HuggingFace importer file
+        found = _find_patterns(_read_bytes(_IMPORTER), _LEXSUM_PATTERNS)
+        
+        # Check for multi_lexsum in supported datasets
+        if '"multi_lexsum"' not in found:
+            print(f"{mark['error']}multi_lexsum not found in supported datasets")
+            return False
+        
+        # Check for the correct path
+        if '"allenai/multi_lexsum"' not in found:
+            print(f"{mark['error']}multi_lexsum path not found")
+            return False
+        
+        # Check for the name field
+        if '"v20220616"' not in found:
+            print(f"{mark['error']}multi_lexsum version name not found")
+            return False
+        
+        # Check for formatting logic
+        if 'summary/long' not in found:
+            print(f"{mark['error']}multi_lexsum summary formatting not found")
+            return False
+        
+        print(f"{mark['ok']}multi_lexsum integration looks correct")
+        return True
+        
+    except Exception as e:
+        print(f"{mark['error']}Error checking multi_lexsum integration: {e}")
+        return False
+
+def check_model_trainers(mark):
+    """Check if model trainers are properly implemented"""
+    print(f"\n{mark['check']}Checking model trainers...")
+    
+    for filename, class_name in _TRAINERS:
+        file_path = os.path.join(_MODELS, filename)
+        
+        # Reading straight away lets a missing file surface as one ENOENT instead of a stat first
+        try:
+            found = _find_patterns(
+                _read_bytes(file_path), (f"class {class_name}", "def train", "def generate_summary")
+            )
+            
+            if f"class {class_name}" not in found:
+                print(f"{mark['error']}{class_name} class not found in {filename}")
+                return False
+            
+            if "def train" not in found:
+                print(f"{mark['error']}train method not found in {filename}")
+                return False
+            
+            if "def generate_summary" not in found:
+                print(f"{mark['error']}generate_summary method not found in {filename}")
+                return False
+                
+        except FileNotFoundError:
+            print(f"{mark['error']}{filename} not found")
+            return False
+        except Exception as e:
+            print(f"{mark['error']}Error checking {filename}: {e}")
+            return False
+    
+    print(f"{mark['ok']}All model trainers are properly implemented")
+    return True
+
+def check_utilities(mark):
+    """Check if utility files are properly implemented"""
+    print(f"\n{mark['check']}Checking utility files...")
+    
+    for filename, required_elements in _UTILITIES:
+        file_path = os.path.join(_UTILS, filename)
+        
+        # Reading straight away lets a missing file surface as one ENOENT instead of a stat first
+        try:
+            found = _find_patterns(_read_bytes(file_path), required_elements)
+            
+            for element in required_elements:
+                if element not in found:
+                    print(f"{mark['error']}{element} not found in {filename}")
+                    return False
+                    
+        except FileNotFoundError:
+            print(f"{mark['error']}{filename} not found")
+            return False
+        except Exception as e:
+            print(f"{mark['error']}Error checking {filename}: {e}")
+            return False
+    
+    print(f"{mark['ok']}All utility files are properly implemented")
+    return True
+
+def check_routes(mark):
+    """Check if API routes are properly implemented"""
+    print(f"\n{mark['check']}Checking API routes...")
+    
+    for filename, required_endpoints in _REQUIRED_ROUTES:
+        file_path = os.path.join(_ROUTES, filename)
+        
+        # Reading straight away lets a missing file surface as one ENOENT instead of a stat first
+        try:
+            found = _find_patterns(_read_bytes(file_path), required_endpoints)
+            
+            for endpoint in required_endpoints:
+                if endpoint not in found:
+                    print(f"{mark['error']}{endpoint} not found in {filename}")
+                    return False
+                    
+        except FileNotFoundError:
+            print(f"{mark['error']}{filename} not found")
+            return False
+        except Exception as e:
+            print(f"{mark['error']}Error checking {filename}: {e}")
+            return False
+    
+    print(f"{mark['ok']}All API routes are properly implemented")
+    return True
+
+# A requirement's name ends at its first extra, version specifier, marker or whitespace
+_REQUIREMENT_NAME_END = re.compile(rb"[\s\[<>=!~;@]")
+
+def _requirement_names(content):
+    """Return the normalised package names declared in requirements.txt content, parsed in one pass"""
+    names = set()
+    # mmap has no splitlines, and requirements.txt is small enough to copy
+    for line in bytes(content).splitlines():
+        line = line.strip()
+        if not line or line.startswith(b"#"):
+            continue
+        name = _REQUIREMENT_NAME_END.split(line, 1)[0]
+        # Exact names, so torch is not satisfied by torchvision; PEP 503 treats _ and . like -
+        names.add(name.decode('ascii', 'replace').lower().replace("_", "-").replace(".", "-"))
+    return names
+
+def check_requirements(mark):
+    """Check if requirements.txt contains necessary packages"""
+    print(f"\n{mark['check']}Checking requirements...")
+    
+    try:
+        requirements = _read_bytes(_REQUIREMENTS)
+        
+        declared = _requirement_names(requirements)
+        missing_packages = [package for package in _REQUIRED_PACKAGES if package not in declared]
+        
+        if missing_packages:
+            print(f"{mark['error']}Missing packages in requirements: {missing_packages}")
+            return False
+        
+        print(f"{mark['ok']}All required packages are in requirements.txt")
+        return True
+        
+    except FileNotFoundError:
+        print(f"{mark['error']}requirements.txt not found")
+        return False
+    except Exception as e:
+        print(f"{mark['error']}Error checking requirements: {e}")
+        return False
+
+# Project overview written to project_summary.json
+_PROJECT_SUMMARY = {
+    "project_name": "Lexicognize - AI Legal Text Summarization and Simplification",
+    "description": "A comprehensive platform for fine-tuning and using AI models for legal text summarization and simplification",
+    "key_features": [
+        "Multi-model support (BART, PEGASUS, Multilingual)",
+        "HuggingFace dataset integration (including multi_lexsum)",
+        "User authentication and model management",
+        "Training and evaluation pipelines",
+        "RESTful API with FastAPI",
+        "Data processing and validation",
+        "Batch inference capabilities"
+    ],
+    "supported_datasets": [
+        "multi_lexsum - Legal summarization with multiple summary lengths",
+        "wikilarge - Wikipedia simplification",
+        "xsum - Extreme summarization",
+        "cnn_dailymail - News summarization",
+        "samsum - Conversation summarization",
+        "legal_bench - Legal NLP benchmark",
+        "contract_nli - Contract analysis",
+        "eurlex - Multi-lingual EU legislation"
+    ],
+    "model_types": [
+        "BART - General purpose summarization",
+        "PEGASUS - Abstractive summarization",
+        "Multilingual - Multi-lingual support",
+        "Multi-task - Combined summarization and simplification"
+    ],
+    "api_endpoints": {
+        "training": "/api/training/*",
+        "datasets": "/api/datasets/*", 
+        "inference": "/api/inference/*",
+        "evaluation": "/api/evaluation/*",
+        "auth": "/api/auth/*"
+    }
+}
+
+def generate_summary_report(mark):
+    """Generate a summary report of the project"""
+    print(f"\n{mark['report']}Generating project summary...")
+    
+    # Save summary to file, leaving it untouched when the content is already current
+    payload = _dump_json(_PROJECT_SUMMARY)
+    
+    try:
+        with open(_SUMMARY_PATH, 'rb') as f:
+            existing = f.read()
+    except FileNotFoundError:
+        existing = None
+    
+    if existing == payload:
+        print(f"{mark['ok']}Summary report at {_SUMMARY_PATH} is up to date (unchanged)")
+        return True
+    
+    with open(_SUMMARY_PATH, 'wb') as f:
+        f.write(payload)
+    
+    print(f"{mark['ok']}Summary report saved to {_SUMMARY_PATH}")
+    return True
+
+def _run_check(check, mark):
+    """Run one check, reporting a failure or error under the check's name"""
+    try:
+        passed = bool(check(mark))
+    except Exception as e:
+        print(f"{mark['error']}Error in {check.__name__}: {e}")
+        return False
+    if not passed:
+        print(f"{mark['error']}Check failed: {check.__name__}")
+    return passed
+
+def run(emoji=False, write_summary=True):
+    """Run every validation check, printing emoji or plain-text status markers; True if all pass"""
+    mark = _MARKERS[emoji]
+    
+    checks = [
+        check_project_structure,
+        check_multi_lexsum_integration,
+        check_model_trainers,
+        check_utilities,
+        check_routes,
+        check_requirements
+    ]
+    if write_summary:
+        checks.append(generate_summary_report)
+    
+    total = len(checks)
+    
+    # Checks are independent and I/O-bound, so run them concurrently and replay their output in order
+    try:
+        results = run_concurrently([partial(_run_check, check, mark) for check in checks])
+    finally:
+        _release_tree()
+    
+    # Emit the header, the captured check output and the summary in a single write
+    passed = sum(check_passed for check_passed, _ in results)
+    report = [f"{mark['start']}Starting Lexicognize Project Validation\n\n", *(output for _, output in results)]
+    report.append(f"\n{mark['results']}Validation Results: {passed}/{total} checks passed\n")
+    
+    if passed == total:
+        report.append(
+            f"{mark['done']}All validation checks passed! The project is ready for use.\n"
+            f"\n{mark['next']}Next Steps:\n"
+            "1. Install dependencies: pip install -r backend/requirements.txt\n"
+            "2. Set up database configuration in backend/app/config.py\n"
+            "3. Run the API server: uvicorn backend.app.main:app --reload\n"
+            "4. Access the API documentation: http://localhost:8000/api/docs\n"
+        )
+    else:
+        report.append(f"{mark['warn']}Some validation checks failed. Please review and fix the issues.\n")
+    
+    sys.stdout.write("".join(report))
+    sys.stdout.flush()
+    return passed == total
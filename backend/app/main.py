@@ -389,6 +389,16 @@ async def startup_event():
     for directory in directories:
         os.makedirs(directory, exist_ok=True)
     
+    # Preload common translation models in the background so the first request doesn't pay for it
+    warm_pairs = [pair for pair in os.getenv("TRANSLATION_WARM_PAIRS", "en-hi,hi-en").split(",") if pair]
+    if warm_pairs:
+        try:
+            from app.routes.translation import translator
+            translator.warm(warm_pairs)
+            logger.info(f"Warming translation models for: {', '.join(warm_pairs)}")
+        except Exception as e:
+            logger.warning(f"Could not start translation model warmup: {e}")
+    
     logger.info("✓ Application startup completed")
     logger.info("✓ Training capabilities enabled")
     logger.info("✓ Available models: BART, PEGASUS, Multilingual T5")
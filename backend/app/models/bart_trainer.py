@@ -18,6 +18,8 @@ import logging
 from datetime import datetime
 import evaluate
 
+from app.utils.compile_utils import compile_with_fallback
+
 logger = logging.getLogger(__name__)
 
 class BARTDataset(Dataset):
@@ -77,6 +79,8 @@ class BARTTrainer:
         self.model = None
         self.tokenizer = None
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        # Checkpoints loaded for generation, keyed by (model_path, use_compile)
+        self._generation_models = {}
     
     def prepare_data(self, data: List[Dict], train_ratio: float = 0.8) -> Tuple:
         """Prepare data for training and validation"""
@@ -199,6 +203,11 @@ class BARTTrainer:
         trainer.save_model(output_dir)
         self.tokenizer.save_pretrained(output_dir)
         
+        # Drop generation models cached from an older checkpoint in this directory
+        self._generation_models = {
+            key: cached for key, cached in self._generation_models.items() if key[0] != output_dir
+        }
+        
         # Save training metrics
         metrics = train_result.metrics
         metrics_path = os.path.join(output_dir, "training_metrics.json")
@@ -301,17 +310,41 @@ class BARTTrainer:
         
         return results
     
-    def generate_summary(self, text: str, model_path: Optional[str] = None, max_length: int = 256) -> str:
-        """Generate summary for a single text"""
-        if model_path:
+    def _load_generation_model(self, model_path: str, use_compile: bool) -> Tuple:
+        """Load a checkpoint for generation once, optionally torch.compile-ing encoder and decoder"""
+        key = (model_path, use_compile)
+        if key not in self._generation_models:
             model = BartForConditionalGeneration.from_pretrained(model_path)
             tokenizer = BartTokenizer.from_pretrained(model_path)
+            model.to(self.device)
+            model.eval()
+            
+            # generate() calls the encoder once and the decoder per step, so compile them separately
+            if use_compile:
+                for module in (model.model.encoder, model.model.decoder):
+                    module.forward = compile_with_fallback(module.forward, model_path)
+            
+            self._generation_models[key] = (model, tokenizer)
+        return self._generation_models[key]
+    
+    def generate_summary(
+        self,
+        text: str,
+        model_path: Optional[str] = None,
+        max_length: int = 256,
+        use_compile: bool = False,
+        autocast_dtype: Optional[torch.dtype] = None
+    ) -> str:
+        """Generate summary for a single text (use_compile compiles a loaded checkpoint once and reuses it;
+        autocast_dtype, e.g. torch.bfloat16, runs generation under CUDA autocast)"""
+        if model_path:
+            model, tokenizer = self._load_generation_model(model_path, use_compile)
         else:
+            # The in-memory model is also used for training, so it is never compiled here
             model = self.model
             tokenizer = self.tokenizer
-        
-        model.to(self.device)
-        model.eval()
+            model.to(self.device)
+            model.eval()
         
         # Tokenize input
         inputs = tokenizer(
@@ -325,7 +358,10 @@ class BARTTrainer:
         inputs = {k: v.to(self.device) for k, v in inputs.items()}
         
         # Generate summary
-        with torch.no_grad():
+        use_autocast = autocast_dtype is not None and self.device.type == "cuda"
+        with torch.inference_mode(), torch.autocast(
+            device_type=self.device.type, dtype=autocast_dtype, enabled=use_autocast
+        ):
             outputs = model.generate(
                 input_ids=inputs["input_ids"],
                 attention_mask=inputs["attention_mask"],
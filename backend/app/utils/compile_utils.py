@@ -0,0 +1,38 @@
+import functools
+import logging
+import torch
+
+logger = logging.getLogger(__name__)
+
+def compile_with_fallback(fn, name: str, **compile_kwargs):
+    """Compile a callable with torch.compile, falling back to eager mode if compilation fails
+    
+    torch.compile only compiles on the first call, so compile errors surface there rather than
+    here. A failing compiled call is retried eagerly; if the eager call succeeds the failure came
+    from compilation and every later call runs eagerly, otherwise the eager error is raised.
+    """
+    if not hasattr(torch, "compile"):
+        return fn
+    try:
+        compiled = torch.compile(fn, **compile_kwargs)
+    except Exception as e:
+        logger.warning(f"torch.compile failed for {name}, using eager mode: {e}")
+        return fn
+    
+    use_compiled = True
+    
+    @functools.wraps(fn)
+    def run(*args, **kwargs):
+        nonlocal use_compiled
+        if not use_compiled:
+            return fn(*args, **kwargs)
+        try:
+            return compiled(*args, **kwargs)
+        except Exception as e:
+            compile_error = e
+        result = fn(*args, **kwargs)
+        use_compiled = False
+        logger.warning(f"torch.compile failed for {name}, using eager mode: {compile_error}")
+        return result
+    
+    return run
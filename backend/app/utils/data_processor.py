@@ -206,10 +206,11 @@ class LegalDataProcessor:
         if not data:
             return {"error": "Empty dataset"}
         
+        valid_samples = sum(1 for sample in data if sample.get('is_valid', True))
         stats = {
             'total_samples': len(data),
-            'valid_samples': sum(1 for sample in data if sample.get('is_valid', True)),
-            'invalid_samples': sum(1 for sample in data if not sample.get('is_valid', True)),
+            'valid_samples': valid_samples,
+            'invalid_samples': len(data) - valid_samples,
             'languages': {},
             'categories': {},
             'text_lengths': [],
@@ -251,30 +252,13 @@ class LegalDataProcessor:
         
         # Calculate summary statistics
         if stats['text_lengths']:
-            stats['text_length_stats'] = {
-                'mean': np.mean(stats['text_lengths']),
-                'median': np.median(stats['text_lengths']),
-                'min': min(stats['text_lengths']),
-                'max': max(stats['text_lengths']),
-                'std': np.std(stats['text_lengths'])
-            }
+            stats['text_length_stats'] = self._describe(stats['text_lengths'])
         
         if stats['summary_lengths']:
-            stats['summary_length_stats'] = {
-                'mean': np.mean(stats['summary_lengths']),
-                'median': np.median(stats['summary_lengths']),
-                'min': min(stats['summary_lengths']),
-                'max': max(stats['summary_lengths']),
-                'std': np.std(stats['summary_lengths'])
-            }
+            stats['summary_length_stats'] = self._describe(stats['summary_lengths'])
         
         if stats['complexity_scores']:
-            stats['complexity_stats'] = {
-                'mean': np.mean(stats['complexity_scores']),
-                'median': np.median(stats['complexity_scores']),
-                'min': min(stats['complexity_scores']),
-                'max': max(stats['complexity_scores'])
-            }
+            stats['complexity_stats'] = self._describe(stats['complexity_scores'], include_std=False)
         
         # Top legal terms
         if stats['legal_terms_frequency']:
@@ -287,6 +271,20 @@ class LegalDataProcessor:
         
         return stats
     
+    @staticmethod
+    def _describe(values: List[float], include_std: bool = True) -> Dict[str, float]:
+        """Summary statistics computed over a single NumPy array conversion"""
+        arr = np.asarray(values)
+        described = {
+            'mean': arr.mean(),
+            'median': np.median(arr),
+            'min': arr.min().item(),
+            'max': arr.max().item()
+        }
+        if include_std:
+            described['std'] = arr.std()
+        return described
+    
     def filter_dataset(
         self,
         data: List[Dict],
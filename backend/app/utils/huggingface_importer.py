@@ -1,6 +1,9 @@
-import json
+import copy
 import os
-from typing import Dict, List, Optional, Any
+import tempfile
+import orjson
+from functools import lru_cache
+from typing import Any, Callable, Dict, Final, List, Optional
 import logging
 from datasets import load_dataset, Dataset, DatasetDict
 import pandas as pd
@@ -8,6 +11,85 @@ from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Per-dataset field mapping from a raw Hugging Face sample to our format
+
+def _format_wikilarge(sample: Dict) -> Dict:
+    return {
+        "text": sample.get("original", ""),
+        "simplified": sample.get("simplification", ""),
+        "summary": sample.get("simplification", "")[:200]  # Truncate for summary
+    }
+
+def _format_xsum(sample: Dict) -> Dict:
+    return {
+        "text": sample.get("document", ""),
+        "summary": sample.get("summary", ""),
+        "simplified": sample.get("summary", "")
+    }
+
+def _format_cnn_dailymail(sample: Dict) -> Dict:
+    return {
+        "text": sample.get("article", ""),
+        "summary": sample.get("highlights", ""),
+        "simplified": sample.get("highlights", "")
+    }
+
+def _format_samsum(sample: Dict) -> Dict:
+    return {
+        "text": sample.get("dialogue", ""),
+        "summary": sample.get("summary", ""),
+        "simplified": sample.get("summary", "")
+    }
+
+def _format_caselaw(sample: Dict) -> Dict:
+    return {
+        "text": sample.get("text", ""),
+        "summary": sample.get("summary", ""),
+        "category": "legal"
+    }
+
+def _format_multi_lexsum(sample: Dict) -> Dict:
+    sources = sample.get("sources", [])
+    if isinstance(sources, list) and sources:
+        # Concatenate all source documents
+        text = " ".join(sources)
+    else:
+        text = str(sources) if sources else ""
+    
+    # Use the long summary as primary, fallback to short or tiny
+    summary = (
+        sample.get("summary/long", "") or 
+        sample.get("summary/short", "") or 
+        sample.get("summary/tiny", "")
+    )
+    
+    return {
+        "text": text,
+        "summary": summary,
+        "summary_long": sample.get("summary/long", ""),
+        "summary_short": sample.get("summary/short", ""),
+        "summary_tiny": sample.get("summary/tiny", ""),
+        "category": "legal",
+        "sources_count": len(sources) if isinstance(sources, list) else 1
+    }
+
+def _format_generic(sample: Dict) -> Dict:
+    # Generic format for other datasets
+    return {
+        "text": str(sample.get("text", sample.get("document", sample.get("original", "")))),
+        "summary": str(sample.get("summary", sample.get("labels", ""))),
+        "metadata": sample
+    }
+
+_SAMPLE_FORMATTERS: Final[Dict[str, Callable[[Dict], Dict]]] = {
+    "wikilarge": _format_wikilarge,
+    "xsum": _format_xsum,
+    "cnn_dailymail": _format_cnn_dailymail,
+    "samsum": _format_samsum,
+    "caselaw": _format_caselaw,
+    "multi_lexsum": _format_multi_lexsum,
+}
+
 class HuggingFaceDatasetImporter:
     """Import datasets from Hugging Face Hub"""
     
@@ -78,6 +160,12 @@ class HuggingFaceDatasetImporter:
         }
     }
     
+    # Lowercased searchable text per dataset; newline-separated so matches can't span fields
+    _SEARCH_INDEX = {
+        key: "\n".join((key, config["description"], config["path"])).lower()
+        for key, config in SUPPORTED_DATASETS.items()
+    }
+    
     @staticmethod
     def get_available_datasets() -> List[Dict[str, Any]]:
         """Get list of available datasets from Hugging Face"""
@@ -111,7 +199,7 @@ class HuggingFaceDatasetImporter:
             dataset_id: Dataset identifier from SUPPORTED_DATASETS
             split: Which split to import (train, validation, test)
             sample_size: Number of samples to import (None for all)
-            save_path: Where to save the imported dataset
+            save_path: Where to save the imported dataset (JSON Lines if it ends in .jsonl)
             
         Returns:
             Dictionary with import results
@@ -130,36 +218,67 @@ class HuggingFaceDatasetImporter:
             else:
                 dataset = load_dataset(config["path"], split=split)
             
-            # Convert to list of dictionaries
-            data = []
             total_samples = len(dataset)
             
             # Determine how many samples to take
-            if sample_size and sample_size < total_samples:
-                indices = range(sample_size)
-            else:
-                indices = range(total_samples)
+            if not sample_size or sample_size >= total_samples:
                 sample_size = total_samples
             
-            # Convert to our format
-            for idx in indices:
-                sample = dataset[idx]
-                formatted_sample = HuggingFaceDatasetImporter._format_sample(
-                    sample, config, dataset_id
-                )
-                if formatted_sample:
-                    data.append(formatted_sample)
-            
-            # Save if path provided
+            # Stream formatted samples straight to disk instead of building a list:
+            # one object per line for .jsonl, otherwise an incrementally written JSON array
+            imported_samples = 0
+            jsonl = bool(save_path) and save_path.endswith(".jsonl")
+            out = None
             if save_path:
-                os.makedirs(os.path.dirname(save_path), exist_ok=True)
-                with open(save_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+                save_dir = os.path.dirname(save_path) or "."
+                os.makedirs(save_dir, exist_ok=True)
+                # Write beside the target and move into place only once complete, so a failed
+                # import never leaves a truncated file at save_path
+                fd, tmp_path = tempfile.mkstemp(dir=save_dir, suffix=".tmp")
+                out = os.fdopen(fd, 'wb')
+            
+            try:
+                if out and not jsonl:
+                    out.write(b"[\n")
+                
+                # Zero-copy view of the requested rows, converted Arrow -> Python one batch at a time
+                subset = dataset.select(range(sample_size)) if sample_size < total_samples else dataset
+                
+                # Convert to our format, sharing one import timestamp across samples
+                now_iso = datetime.utcnow().isoformat()
+                for table in subset.with_format("arrow").iter(batch_size=1024):
+                    for sample in table.to_pylist():
+                        formatted_sample = HuggingFaceDatasetImporter._format_sample(
+                            sample, config, dataset_id, now_iso
+                        )
+                        if not formatted_sample:
+                            continue
+                        
+                        if out:
+                            if imported_samples and not jsonl:
+                                out.write(b",\n")
+                            out.write(orjson.dumps(formatted_sample))
+                            if jsonl:
+                                out.write(b"\n")
+                        imported_samples += 1
+                
+                if out:
+                    if not jsonl:
+                        out.write(b"\n]\n")
+                    out.close()
+                    # mkstemp creates the file owner-only; give the dataset normal file permissions
+                    os.chmod(tmp_path, 0o644)
+                    os.replace(tmp_path, save_path)
+            except BaseException:
+                if out:
+                    out.close()
+                    os.unlink(tmp_path)
+                raise
             
             return {
                 "dataset_id": dataset_id,
                 "dataset_name": config["path"],
-                "imported_samples": len(data),
+                "imported_samples": imported_samples,
                 "total_samples": total_samples,
                 "config": config,
                 "save_path": save_path,
@@ -175,77 +294,22 @@ class HuggingFaceDatasetImporter:
             }
     
     @staticmethod
-    def _format_sample(sample: Dict, config: Dict, dataset_id: str) -> Optional[Dict]:
+    def _format_sample(
+        sample: Dict,
+        config: Dict,
+        dataset_id: str,
+        now_iso: Optional[str] = None
+    ) -> Optional[Dict]:
         """Format sample to our standard format"""
         try:
             formatted = {
                 "source_dataset": dataset_id,
-                "imported_at": datetime.utcnow().isoformat()
+                "imported_at": now_iso or datetime.utcnow().isoformat()
             }
             
             # Map fields based on dataset type
-            if dataset_id == "wikilarge":
-                formatted.update({
-                    "text": sample.get("original", ""),
-                    "simplified": sample.get("simplification", ""),
-                    "summary": sample.get("simplification", "")[:200]  # Truncate for summary
-                })
-            elif dataset_id == "xsum":
-                formatted.update({
-                    "text": sample.get("document", ""),
-                    "summary": sample.get("summary", ""),
-                    "simplified": sample.get("summary", "")
-                })
-            elif dataset_id == "cnn_dailymail":
-                formatted.update({
-                    "text": sample.get("article", ""),
-                    "summary": sample.get("highlights", ""),
-                    "simplified": sample.get("highlights", "")
-                })
-            elif dataset_id == "samsum":
-                formatted.update({
-                    "text": sample.get("dialogue", ""),
-                    "summary": sample.get("summary", ""),
-                    "simplified": sample.get("summary", "")
-                })
-            elif dataset_id == "caselaw":
-                formatted.update({
-                    "text": sample.get("text", ""),
-                    "summary": sample.get("summary", ""),
-                    "category": "legal"
-                })
-            elif dataset_id == "multi_lexsum":
-                # Handle multi_lexsum specific format
-                sources = sample.get("sources", [])
-                if isinstance(sources, list) and sources:
-                    # Concatenate all source documents
-                    text = " ".join(sources)
-                else:
-                    text = str(sources) if sources else ""
-                
-                # Use the long summary as primary, fallback to short or tiny
-                summary = (
-                    sample.get("summary/long", "") or 
-                    sample.get("summary/short", "") or 
-                    sample.get("summary/tiny", "")
-                )
-                
-                formatted.update({
-                    "text": text,
-                    "summary": summary,
-                    "summary_long": sample.get("summary/long", ""),
-                    "summary_short": sample.get("summary/short", ""),
-                    "summary_tiny": sample.get("summary/tiny", ""),
-                    "category": "legal",
-                    "sources_count": len(sources) if isinstance(sources, list) else 1
-                })
-            else:
-                # Generic format for other datasets
-                formatted.update({
-                    "text": str(sample.get("text", sample.get("document", sample.get("original", "")))),
-                    "summary": str(sample.get("summary", sample.get("labels", ""))),
-                    "metadata": sample
-                })
+            handler = _SAMPLE_FORMATTERS.get(dataset_id, _format_generic)
+            formatted.update(handler(sample))
             
             # Ensure required fields
             if not formatted.get("text") or len(formatted["text"]) < 10:
@@ -261,13 +325,11 @@ class HuggingFaceDatasetImporter:
     def search_datasets(query: str, task: str = None) -> List[Dict[str, Any]]:
         """Search for datasets by query and task"""
         results = []
+        query = query.lower()
         
-        for key, config in HuggingFaceDatasetImporter.SUPPORTED_DATASETS.items():
-            matches_query = (
-                query.lower() in key.lower() or
-                query.lower() in config["description"].lower() or
-                query.lower() in config["path"].lower()
-            )
+        for key, search_text in HuggingFaceDatasetImporter._SEARCH_INDEX.items():
+            config = HuggingFaceDatasetImporter.SUPPORTED_DATASETS[key]
+            matches_query = query in search_text
             
             matches_task = task is None or config["task"] == task
             
@@ -282,6 +344,30 @@ class HuggingFaceDatasetImporter:
         
         return results
     
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _load_sample_stats(dataset_id: str) -> Dict[str, Any]:
+        """Load a small sample once per dataset and compute basic stats (failures are not cached)"""
+        config = HuggingFaceDatasetImporter.SUPPORTED_DATASETS[dataset_id]
+        
+        # Load a small sample to get stats
+        if dataset_id == "multi_lexsum":
+            dataset = load_dataset(config["path"], name=config["name"], split="train[:100]")
+        else:
+            dataset = load_dataset(config["path"], split="train[:100]")
+        
+        # Calculate basic statistics
+        return {
+            "sample_count": len(dataset),
+            "fields": list(dataset.features.keys()),
+            "example": dataset[0] if len(dataset) > 0 else None
+        }
+    
+    @staticmethod
+    def _sample_stats(dataset_id: str) -> Dict[str, Any]:
+        """Get a dataset's sample stats as a copy the caller may modify without touching the cache"""
+        return copy.deepcopy(HuggingFaceDatasetImporter._load_sample_stats(dataset_id))
+    
     @staticmethod
     def get_dataset_info(dataset_id: str) -> Dict[str, Any]:
         """Get detailed information about a dataset"""
@@ -291,18 +377,7 @@ class HuggingFaceDatasetImporter:
         config = HuggingFaceDatasetImporter.SUPPORTED_DATASETS[dataset_id]
         
         try:
-            # Load a small sample to get stats
-            if dataset_id == "multi_lexsum":
-                dataset = load_dataset(config["path"], name=config["name"], split="train[:100]")
-            else:
-                dataset = load_dataset(config["path"], split="train[:100]")
-            
-            # Calculate basic statistics
-            stats = {
-                "sample_count": len(dataset),
-                "fields": list(dataset.features.keys()),
-                "example": dataset[0] if len(dataset) > 0 else None
-            }
+            stats = HuggingFaceDatasetImporter._sample_stats(dataset_id)
             
             return {
                 **config,
@@ -1,9 +1,28 @@
+import os
 import re
 from typing import Dict, List, Optional, Tuple
 import langid
 from langdetect import detect, DetectorFactory
 DetectorFactory.seed = 0
 
+# Optional fastText language-identification model (lid.176.bin)
+FASTTEXT_MODEL_PATH = os.getenv("FASTTEXT_LID_MODEL", "lid.176.bin")
+_fasttext_model = None
+_fasttext_checked = False
+
+def _get_fasttext_model():
+    """Lazily load the fastText language-id model, or None if unavailable"""
+    global _fasttext_model, _fasttext_checked
+    if not _fasttext_checked:
+        _fasttext_checked = True
+        try:
+            import fasttext
+            if os.path.exists(FASTTEXT_MODEL_PATH):
+                _fasttext_model = fasttext.load_model(FASTTEXT_MODEL_PATH)
+        except Exception:
+            _fasttext_model = None
+    return _fasttext_model
+
 class LanguageUtils:
     """Utility class for language detection and processing"""
     
@@ -52,6 +71,26 @@ class LanguageUtils:
             except:
                 return 'en', 0.5  # Default to English
     
+    @staticmethod
+    def detect_many(texts: List[str]) -> List[Tuple[str, float]]:
+        """Detect languages for many texts, batched through fastText when available"""
+        if not texts:
+            return []
+        
+        model = _get_fasttext_model()
+        if model is not None:
+            try:
+                # fastText rejects newlines inside a single input line
+                labels, probs = model.predict([t.replace('\n', ' ') for t in texts], k=1)
+                return [
+                    (label[0].replace('__label__', ''), float(prob[0]))
+                    for label, prob in zip(labels, probs)
+                ]
+            except Exception:
+                pass
+        
+        return [LanguageUtils.detect_language(text) for text in texts]
+    
     @staticmethod
     def is_indian_language(lang_code: str) -> bool:
         """Check if language is Indian"""
@@ -72,20 +111,18 @@ class LanguageUtils:
     def split_text_by_language(text: str) -> List[Dict]:
         """Split multilingual text by language segments"""
         # Simple heuristic: split by sentences and detect language for each
-        sentences = re.split(r'[.!?।॥]+', text)
+        sentences = [s.strip() for s in re.split(r'[.!?।॥]+', text)]
+        sentences = [s for s in sentences if s]
         segments = []
         
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if sentence:
-                lang, confidence = LanguageUtils.detect_language(sentence)
-                if confidence > 0.7:  # Only add if confident
-                    segments.append({
-                        'text': sentence,
-                        'language': lang,
-                        'confidence': confidence,
-                        'language_name': LanguageUtils.get_language_name(lang)
-                    })
+        for sentence, (lang, confidence) in zip(sentences, LanguageUtils.detect_many(sentences)):
+            if confidence > 0.7:  # Only add if confident
+                segments.append({
+                    'text': sentence,
+                    'language': lang,
+                    'confidence': confidence,
+                    'language_name': LanguageUtils.get_language_name(lang)
+                })
         
         return segments
     
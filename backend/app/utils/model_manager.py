@@ -1,70 +1,223 @@
 import os
 import json
+import asyncio
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import Future, ThreadPoolExecutor
+import orjson
 import torch
 from transformers import (
     AutoTokenizer,
     AutoModelForSeq2SeqLM,
+    BitsAndBytesConfig,
     pipeline,
     Trainer,
     TrainingArguments
 )
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Literal, Optional, Any
 import logging
 from datetime import datetime
 
+from app.utils.compile_utils import compile_with_fallback
+
 logger = logging.getLogger(__name__)
 
+# Allow TF32 matmuls for any remaining FP32 ops on Ampere+ GPUs
+torch.set_float32_matmul_precision("high")
+torch.backends.cuda.matmul.allow_tf32 = True
+torch.backends.cudnn.benchmark = True
+
+Precision = Literal['fp16', 'bf16', 'int8', 'int4']
+
 class ModelManager:
     """Manager for loading and using trained models"""
     
-    _models_cache = {}
-    _tokenizers_cache = {}
+    # LRU of loaded (model, tokenizer, device) tuples keyed by (model_name, precision),
+    # bounded to keep GPU memory in check
+    _models_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+    _cache_size = int(os.getenv("MODEL_CACHE_SIZE", "3"))
+    # Default inference precision; unset means bf16/fp16 on GPU and fp32 on CPU
+    _default_precision: Optional[str] = os.getenv("MODEL_PRECISION") or None
+    _cache_lock = threading.RLock()
+    # Loads in progress keyed like _models_cache; the load itself runs outside _cache_lock
+    _loading: Dict[tuple, Future] = {}
+    # Generation pipelines keyed by (model_name, task)
+    _pipelines_cache: Dict[tuple, Any] = {}
+    # One single-worker executor per model so concurrent requests queue on one GPU stream.
+    # Guarded by its own lock so the event loop never waits on _cache_lock
+    _executors: Dict[str, ThreadPoolExecutor] = {}
+    _executors_lock = threading.Lock()
+    # Number of in-flight generations per model name; pinned models are never evicted
+    _pins: Dict[str, int] = {}
+    # Last get_available_models result with the directory mtimes it was built from
+    _models_dir_cache: Optional[tuple] = None
     
     @staticmethod
     def get_available_models() -> List[Dict[str, Any]]:
         """Get list of all available trained models"""
         models_dir = "data/models"
-        available_models = []
-        
-        if os.path.exists(models_dir):
-            for model_name in os.listdir(models_dir):
-                model_path = os.path.join(models_dir, model_name)
-                if os.path.isdir(model_path):
-                    # Check if it's a valid model directory
-                    config_path = os.path.join(model_path, "config.json")
-                    if os.path.exists(config_path):
-                        try:
-                            with open(config_path, 'r') as f:
-                                config = json.load(f)
-                            
-                            # Load metadata if exists
-                            metadata_path = os.path.join(model_path, "metadata.json")
-                            metadata = {}
-                            if os.path.exists(metadata_path):
-                                with open(metadata_path, 'r') as f:
-                                    metadata = json.load(f)
-                            
-                            available_models.append({
-                                "name": model_name,
-                                "path": model_path,
-                                "config": config,
-                                "metadata": metadata,
-                                "type": metadata.get("model_type", "unknown"),
-                                "task": metadata.get("task", "unknown"),
-                                "created_at": metadata.get("created_at", 
-                                                         datetime.fromtimestamp(os.path.getmtime(model_path)).isoformat())
-                            })
-                        except Exception as e:
-                            logger.error(f"Error loading model info for {model_name}: {e}")
-        
-        return available_models
-    
-    @staticmethod
-    def load_model(model_name: str, use_cache: bool = True):
+        
+        try:
+            dir_stat = os.stat(models_dir)
+        except FileNotFoundError:
+            return []
+        
+        with os.scandir(models_dir) as it:
+            entries = [entry for entry in it if entry.is_dir()]
+        
+        # Reuse the previous scan while neither the models directory nor any model directory changed
+        signature = (
+            dir_stat.st_mtime_ns,
+            tuple(sorted((entry.name, entry.stat().st_mtime_ns) for entry in entries))
+        )
+        cached = ModelManager._models_dir_cache
+        if cached is not None and cached[0] == signature:
+            return list(cached[1])
+        
+        # Config/metadata reads are independent and IO-bound, so overlap them
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = executor.map(ModelManager._load_model_info, entries)
+        available_models = [info for info in results if info is not None]
+        
+        ModelManager._models_dir_cache = (signature, available_models)
+        return list(available_models)
+    
+    @staticmethod
+    def _load_model_info(entry: os.DirEntry) -> Optional[Dict[str, Any]]:
+        """Load config and metadata for one model directory, or None if it isn't a model"""
+        model_name = entry.name
+        model_path = entry.path
+        try:
+            # Check if it's a valid model directory
+            with open(os.path.join(model_path, "config.json"), 'rb') as f:
+                config = orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Error loading model info for {model_name}: {e}")
+            return None
+        
+        try:
+            # Load metadata if exists
+            metadata = {}
+            metadata_path = os.path.join(model_path, "metadata.json")
+            if os.path.exists(metadata_path):
+                with open(metadata_path, 'rb') as f:
+                    metadata = orjson.loads(f.read())
+            
+            return {
+                "name": model_name,
+                "path": model_path,
+                "config": config,
+                "metadata": metadata,
+                "type": metadata.get("model_type", "unknown"),
+                "task": metadata.get("task", "unknown"),
+                "created_at": metadata.get("created_at", 
+                                         datetime.fromtimestamp(entry.stat().st_mtime).isoformat())
+            }
+        except Exception as e:
+            logger.error(f"Error loading model info for {model_name}: {e}")
+            return None
+    
+    @staticmethod
+    def _evict(cache_key: tuple, entry: tuple):
+        """Release a model displaced from the cache"""
+        model_name = cache_key[0]
+        model = entry[0]
+        logger.info(f"Evicting model {model_name} from cache")
+        for key in [k for k in ModelManager._pipelines_cache if k[0] == model_name]:
+            del ModelManager._pipelines_cache[key]
+        try:
+            model.to('cpu')
+        except Exception as e:
+            logger.warning(f"Error moving model {model_name} to CPU: {e}")
+        del model
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+        
+        # Stop the model's generation thread once no cached precision of it is left
+        if not any(key[0] == model_name for key in ModelManager._models_cache):
+            with ModelManager._executors_lock:
+                executor = ModelManager._executors.pop(model_name, None)
+            if executor is not None:
+                executor.shutdown(wait=False)
+    
+    @staticmethod
+    def _trim_cache(keep: Optional[tuple] = None):
+        """Evict least recently used models beyond the cache size, skipping models in use"""
+        cache = ModelManager._models_cache
+        limit = max(ModelManager._cache_size, 1)
+        for key in list(cache):
+            if len(cache) <= limit:
+                break
+            if key == keep or ModelManager._pins.get(key[0]):
+                continue
+            ModelManager._evict(key, cache.pop(key))
+    
+    @staticmethod
+    def load_model(
+        model_name: str,
+        use_cache: bool = True,
+        precision: Optional[Precision] = None
+    ):
         """Load a trained model"""
-        if use_cache and model_name in ModelManager._models_cache:
-            return ModelManager._models_cache[model_name]
+        precision = precision or ModelManager._default_precision
+        if not use_cache:
+            return ModelManager._load_model_uncached(model_name, precision)
+        
+        cache_key = (model_name, precision)
+        with ModelManager._cache_lock:
+            cache = ModelManager._models_cache
+            if cache_key in cache:
+                cache.move_to_end(cache_key)
+                return cache[cache_key]
+            
+            # Concurrent requests for the same model share one load
+            pending = ModelManager._loading.get(cache_key)
+            is_loader = pending is None
+            if is_loader:
+                pending = Future()
+                ModelManager._loading[cache_key] = pending
+        
+        if not is_loader:
+            return pending.result()
         
+        # Load without holding the cache lock so requests for other models aren't blocked
+        try:
+            entry = ModelManager._load_model_uncached(model_name, precision)
+        except Exception as e:
+            with ModelManager._cache_lock:
+                del ModelManager._loading[cache_key]
+            pending.set_exception(e)
+            raise
+        
+        with ModelManager._cache_lock:
+            del ModelManager._loading[cache_key]
+            ModelManager._models_cache[cache_key] = entry
+            # Models still generating stay cached; they are trimmed once released
+            ModelManager._trim_cache(keep=cache_key)
+        pending.set_result(entry)
+        
+        return entry
+    
+    @staticmethod
+    def _quantization_config(precision: Optional[str]) -> Optional[BitsAndBytesConfig]:
+        """Get the bitsandbytes config for an int8/int4 precision"""
+        if precision == 'int8':
+            return BitsAndBytesConfig(load_in_8bit=True)
+        if precision == 'int4':
+            return BitsAndBytesConfig(
+                load_in_4bit=True,
+                bnb_4bit_compute_dtype=(
+                    torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+                )
+            )
+        return None
+    
+    @staticmethod
+    def _load_model_uncached(model_name: str, precision: Optional[str] = None):
+        """Load a model and tokenizer from disk"""
         models_dir = "data/models"
         model_path = os.path.join(models_dir, model_name)
         
@@ -73,19 +226,51 @@ class ModelManager:
         
         try:
             # Load tokenizer
-            tokenizer = AutoTokenizer.from_pretrained(model_path)
+            tokenizer = AutoTokenizer.from_pretrained(
+                model_path,
+                use_fast=True,
+                local_files_only=True,
+                trust_remote_code=False
+            )
+            
+            device = 0 if torch.cuda.is_available() else -1
+            # Trained models live on disk, so skip Hub lookups and remote code
+            load_kwargs = {
+                "low_cpu_mem_usage": True,
+                "local_files_only": True,
+                "trust_remote_code": False
+            }
+            
+            if precision in ('int8', 'int4') and device < 0:
+                logger.warning(f"{precision} quantization requires CUDA, loading {model_name} in full precision")
+                precision = None
+            
+            quantization_config = ModelManager._quantization_config(precision)
+            if quantization_config is not None:
+                # bitsandbytes places the weights itself via device_map
+                load_kwargs["quantization_config"] = quantization_config
+                load_kwargs["device_map"] = "auto"
+            elif device >= 0:
+                # Load model in half precision on GPU
+                if precision == 'fp16':
+                    load_kwargs["torch_dtype"] = torch.float16
+                elif precision == 'bf16' or torch.cuda.is_bf16_supported():
+                    load_kwargs["torch_dtype"] = torch.bfloat16
+                else:
+                    load_kwargs["torch_dtype"] = torch.float16
+            
+            model = AutoModelForSeq2SeqLM.from_pretrained(model_path, **load_kwargs)
+            model.eval()
+            model.generation_config.use_cache = True
             
-            # Load model
-            model = AutoModelForSeq2SeqLM.from_pretrained(model_path)
+            if quantization_config is not None:
+                # Already dispatched; pipelines must not move the model again
+                return model, tokenizer, None
             
             # Move to GPU if available
-            device = 0 if torch.cuda.is_available() else -1
             if device >= 0:
                 model = model.to(device)
-            
-            if use_cache:
-                ModelManager._models_cache[model_name] = model
-                ModelManager._tokenizers_cache[model_name] = tokenizer
+                model = ModelManager._compile_model(model, model_name)
             
             return model, tokenizer, device
             
@@ -93,6 +278,93 @@ class ModelManager:
             logger.error(f"Error loading model {model_name}: {e}")
             raise
     
+    @staticmethod
+    def _compile_model(model, model_name: str):
+        """Compile a model's forward with torch.compile, falling back to eager mode"""
+        # generate() calls model.forward once per decoding step; wrapping the whole module in an
+        # OptimizedModule would leave generate() running the uncompiled original. Sequence length
+        # grows every step, so compile for dynamic shapes instead of one graph per length.
+        model.forward = compile_with_fallback(model.forward, model_name, dynamic=True)
+        return model
+    
+    @staticmethod
+    def _get_pipeline(model_name: str, task: str):
+        """Get a cached generation pipeline for a model and task"""
+        key = (model_name, task)
+        model, tokenizer, device = ModelManager.load_model(model_name)
+        with ModelManager._cache_lock:
+            cached = ModelManager._pipelines_cache.get(key)
+            # Rebuild if the underlying model was evicted and reloaded
+            if cached is None or cached.model is not model:
+                cached = pipeline(
+                    task,
+                    model=model,
+                    tokenizer=tokenizer,
+                    device=device
+                )
+                ModelManager._pipelines_cache[key] = cached
+            return cached
+    
+    @staticmethod
+    @contextmanager
+    def _pinned_pipeline(model_name: str, task: str):
+        """Yield a model's generation pipeline, keeping the model from being evicted while in use"""
+        # Pin before loading so the model can't be evicted between its load and its use
+        with ModelManager._cache_lock:
+            ModelManager._pins[model_name] = ModelManager._pins.get(model_name, 0) + 1
+        try:
+            yield ModelManager._get_pipeline(model_name, task)
+        finally:
+            with ModelManager._cache_lock:
+                remaining = ModelManager._pins[model_name] - 1
+                if remaining:
+                    ModelManager._pins[model_name] = remaining
+                else:
+                    del ModelManager._pins[model_name]
+                    # Apply any eviction that was deferred while this model was in use
+                    ModelManager._trim_cache()
+    
+    @staticmethod
+    def _run_pipeline(generator, inputs, **kwargs):
+        """Run a generation pipeline without autograd tracking"""
+        with torch.inference_mode():
+            return generator(inputs, **kwargs)
+    
+    @staticmethod
+    def _generation_kwargs(
+        max_length: int,
+        min_length: int,
+        num_beams: int,
+        temperature: float
+    ) -> Dict[str, Any]:
+        """Build generation arguments, sampling only for non-beam decoding"""
+        kwargs = {
+            "max_length": max_length,
+            "min_length": min_length,
+            "num_beams": num_beams,
+            "truncation": True
+        }
+        if num_beams <= 1:
+            kwargs["do_sample"] = True
+            kwargs["temperature"] = temperature
+        return kwargs
+    
+    @staticmethod
+    def _submit_to_model_executor(model_name: str, func, *args):
+        """Queue work on the single-worker executor that serializes generation for a model"""
+        # Submit under the lock so an eviction can't shut the executor down in between
+        with ModelManager._executors_lock:
+            executor = ModelManager._executors.get(model_name)
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"generate-{model_name}")
+                ModelManager._executors[model_name] = executor
+            return executor.submit(func, *args)
+    
+    @staticmethod
+    async def _run_in_model_executor(model_name: str, func, *args):
+        """Run blocking model work off the event loop, queued per model"""
+        return await asyncio.wrap_future(ModelManager._submit_to_model_executor(model_name, func, *args))
+    
     @staticmethod
     async def generate_summary(
         model_name: str,
@@ -104,61 +376,55 @@ class ModelManager:
     ) -> str:
         """Generate summary using specified model"""
         try:
-            model, tokenizer, device = ModelManager.load_model(model_name)
-            
-            # Create summarization pipeline
-            summarizer = pipeline(
-                "summarization",
-                model=model,
-                tokenizer=tokenizer,
-                device=device
+            return await ModelManager._run_in_model_executor(
+                model_name,
+                ModelManager._generate_summary_sync,
+                model_name, text, max_length, min_length, num_beams, temperature
             )
             
-            # Split long text into chunks if needed
-            if len(text.split()) > 1000:
-                chunks = ModelManager._chunk_text(text, max_chunk_size=1000)
-                summaries = []
+        except Exception as e:
+            logger.error(f"Error generating summary: {e}")
+            raise
+    
+    @staticmethod
+    def _generate_summary_sync(
+        model_name: str,
+        text: str,
+        max_length: int,
+        min_length: int,
+        num_beams: int,
+        temperature: float
+    ) -> str:
+        """Blocking implementation of generate_summary"""
+        with ModelManager._pinned_pipeline(model_name, "summarization") as summarizer:
+            gen_kwargs = ModelManager._generation_kwargs(max_length, min_length, num_beams, temperature)
+            
+            # Split long text into chunks of at most `window` tokens if needed
+            tokenizer = summarizer.tokenizer
+            window = ModelManager._chunk_window(summarizer.model, tokenizer, max_length)
+            input_ids = tokenizer(text, add_special_tokens=False, truncation=False, verbose=False)["input_ids"]
+            if len(input_ids) > window:
+                chunks = ModelManager._chunk_text(input_ids, tokenizer, window)
                 
-                for chunk in chunks:
-                    summary = summarizer(
-                        chunk,
-                        max_length=max_length,
-                        min_length=min_length,
-                        num_beams=num_beams,
-                        temperature=temperature,
-                        do_sample=True
-                    )[0]['summary_text']
-                    summaries.append(summary)
+                # Summarize all chunks in batches
+                outputs = ModelManager._run_pipeline(
+                    summarizer, chunks, batch_size=min(len(chunks), 8), **gen_kwargs
+                )
+                summaries = [output['summary_text'] for output in outputs]
                 
                 # Combine chunk summaries
                 combined_summary = " ".join(summaries)
                 # Summarize the combined summary if it's too long
                 if len(combined_summary.split()) > 500:
-                    final_summary = summarizer(
-                        combined_summary,
-                        max_length=max_length,
-                        min_length=min_length,
-                        num_beams=num_beams,
-                        temperature=temperature,
-                        do_sample=True
+                    final_summary = ModelManager._run_pipeline(
+                        summarizer, combined_summary, **gen_kwargs
                     )[0]['summary_text']
                 else:
                     final_summary = combined_summary
             else:
-                final_summary = summarizer(
-                    text,
-                    max_length=max_length,
-                    min_length=min_length,
-                    num_beams=num_beams,
-                    temperature=temperature,
-                    do_sample=True
-                )[0]['summary_text']
+                final_summary = ModelManager._run_pipeline(summarizer, text, **gen_kwargs)[0]['summary_text']
             
             return final_summary
-            
-        except Exception as e:
-            logger.error(f"Error generating summary: {e}")
-            raise
     
     @staticmethod
     async def generate_simplification(
@@ -171,42 +437,48 @@ class ModelManager:
     ) -> str:
         """Generate simplified text using specified model"""
         try:
-            model, tokenizer, device = ModelManager.load_model(model_name)
-            
-            # Create text2text generation pipeline
-            simplifier = pipeline(
-                "text2text-generation",
-                model=model,
-                tokenizer=tokenizer,
-                device=device
+            return await ModelManager._run_in_model_executor(
+                model_name,
+                ModelManager._generate_simplification_sync,
+                model_name, text, max_length, min_length, num_beams, temperature
             )
             
-            # Create prompt for simplification
-            prompt = f"Simplify the following legal text: {text}"
-            
-            simplified = simplifier(
-                prompt,
-                max_length=max_length,
-                min_length=min_length,
-                num_beams=num_beams,
-                temperature=temperature,
-                do_sample=True
-            )[0]['generated_text']
-            
-            return simplified
-            
         except Exception as e:
             logger.error(f"Error generating simplification: {e}")
             raise
     
     @staticmethod
-    def _chunk_text(text: str, max_chunk_size: int = 1000) -> List[str]:
-        """Split text into chunks of specified word size"""
-        words = text.split()
+    def _generate_simplification_sync(
+        model_name: str,
+        text: str,
+        max_length: int,
+        min_length: int,
+        num_beams: int,
+        temperature: float
+    ) -> str:
+        """Blocking implementation of generate_simplification"""
+        gen_kwargs = ModelManager._generation_kwargs(max_length, min_length, num_beams, temperature)
+        
+        # Create prompt for simplification
+        prompt = f"Simplify the following legal text: {text}"
+        
+        with ModelManager._pinned_pipeline(model_name, "text2text-generation") as simplifier:
+            return ModelManager._run_pipeline(simplifier, prompt, **gen_kwargs)[0]['generated_text']
+    
+    @staticmethod
+    def _chunk_window(model, tokenizer, max_length: int) -> int:
+        """Get the number of input tokens per chunk for a model"""
+        max_positions = getattr(model.config, "max_position_embeddings", None) or tokenizer.model_max_length
+        # Leave room for special tokens and the generated length, but never go below a usable window
+        return max(max_positions - max_length, 256)
+    
+    @staticmethod
+    def _chunk_text(input_ids: List[int], tokenizer, max_chunk_tokens: int) -> List[str]:
+        """Split tokenized text into decoded chunks of at most max_chunk_tokens tokens"""
         chunks = []
         
-        for i in range(0, len(words), max_chunk_size):
-            chunk = " ".join(words[i:i + max_chunk_size])
+        for i in range(0, len(input_ids), max_chunk_tokens):
+            chunk = tokenizer.decode(input_ids[i:i + max_chunk_tokens], skip_special_tokens=True)
             chunks.append(chunk)
         
         return chunks
@@ -217,6 +489,9 @@ class ModelManager:
         metadata_path = os.path.join(model_path, "metadata.json")
         with open(metadata_path, 'w') as f:
             json.dump(metadata, f, indent=2)
+        
+        # Rewriting an existing file doesn't touch directory mtimes
+        ModelManager._models_dir_cache = None
     
     @staticmethod
     def get_model_metadata(model_name: str) -> Dict[str, Any]:
@@ -1,14 +1,84 @@
 import pdfplumber
+import pikepdf
 import PyPDF2
-import pytesseract
+from tesserocr import PyTessBaseAPI, PSM
 from PIL import Image
+import numpy as np
+import atexit
+import gc
+import hashlib
 import io
 import os
-from typing import Optional, List, Dict
+import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
 import logging
 
+# Pages are OCR'd in parallel, so keep each tesseract run single-threaded
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+OCR_CONCURRENCY = int(os.getenv("OCR_CONCURRENCY", os.cpu_count() or 1))
+# Render resolution for OCR; text pages binarized at 150 DPI OCR well at a quarter of 300 DPI's pixels
+OCR_RESOLUTION = int(os.getenv("OCR_RESOLUTION", 150))
+# Tesseract language(s) used for OCR
+OCR_LANG = os.getenv("OCR_LANG", "eng")
+# Pages parsed per pdfplumber.open call
+PAGE_WINDOW = max(int(os.getenv("PDF_PAGE_WINDOW", 64)), 1)
+# Extracted text is cached here keyed by the PDF's content hash
+TEXT_CACHE_DIR = os.getenv(
+    "PDF_TEXT_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "lexicognize", "ocr")
+)
+# Total size the text cache may grow to before the least recently used entries are removed
+TEXT_CACHE_MAX_BYTES = int(os.getenv("PDF_TEXT_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+# Bump when extraction output changes so older cached text is not reused
+TEXT_CACHE_VERSION = 2
+
 logger = logging.getLogger(__name__)
 
+# Lines that are just a page number
+_PAGE_NUM_RE = re.compile(r'^\s*\d+\s*$', re.MULTILINE)
+
+# Long-lived OCR workers, each holding its own tesseract API so the model loads once per thread
+_ocr_executor: Optional[ThreadPoolExecutor] = None
+_ocr_executor_lock = threading.Lock()
+_ocr_local = threading.local()
+_ocr_apis: List[PyTessBaseAPI] = []
+
+def _get_ocr_executor() -> ThreadPoolExecutor:
+    global _ocr_executor
+    with _ocr_executor_lock:
+        if _ocr_executor is None:
+            _ocr_executor = ThreadPoolExecutor(
+                max_workers=max(OCR_CONCURRENCY, 1),
+                thread_name_prefix="ocr"
+            )
+        return _ocr_executor
+
+def _get_tesseract_api() -> PyTessBaseAPI:
+    api = getattr(_ocr_local, "api", None)
+    if api is None:
+        api = PyTessBaseAPI(lang=OCR_LANG, psm=PSM.AUTO)
+        _ocr_local.api = api
+        with _ocr_executor_lock:
+            _ocr_apis.append(api)
+    return api
+
+@atexit.register
+def _end_tesseract_apis():
+    for api in _ocr_apis:
+        api.End()
+
+@contextmanager
+def _open_reader(pdf_path: str) -> Iterator[PyPDF2.PdfReader]:
+    """Open a PyPDF2 reader for a PDF; the file is closed when the block exits"""
+    with open(pdf_path, 'rb') as f:
+        yield PyPDF2.PdfReader(f)
+
 class PDFExtractor:
     def __init__(self):
         pass
@@ -24,40 +94,24 @@ class PDFExtractor:
         Returns:
             Extracted text as string
         """
-        text_parts = []
-        
         try:
-            # First try with pdfplumber (works well for text-based PDFs)
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(f"--- Page {page_num + 1} ---\n{page_text}")
-                    elif use_ocr:
-                        # If no text found and OCR is enabled, try OCR
-                        ocr_text = self._extract_with_ocr(page)
-                        text_parts.append(f"--- Page {page_num + 1} (OCR) ---\n{ocr_text}")
-            
-            # If pdfplumber didn't extract text, try PyPDF2
-            if not any(text_parts):
-                with open(pdf_path, 'rb') as file:
-                    pdf_reader = PyPDF2.PdfReader(file)
-                    for page_num in range(len(pdf_reader.pages)):
-                        page = pdf_reader.pages[page_num]
-                        page_text = page.extract_text()
-                        if page_text:
-                            text_parts.append(f"--- Page {page_num + 1} ---\n{page_text}")
+            # Identical PDFs (e.g. uploaded twice) reuse the earlier extraction
+            cache_path = self._text_cache_path(pdf_path, use_ocr)
+            cached_text = self._read_text_cache(cache_path)
+            if cached_text is not None:
+                logger.info(f"Using cached text for {pdf_path}")
+                return cached_text
             
-            # If still no text and OCR is enabled, try full document OCR
-            if not any(text_parts) and use_ocr:
-                ocr_text = self._extract_with_ocr_full(pdf_path)
-                text_parts.append(ocr_text)
-            
-            extracted_text = "\n\n".join(text_parts)
+            ocr_failures = []
+            extracted_text = "\n\n".join(self.iter_pages(pdf_path, use_ocr, ocr_failures))
             
             # Clean up the text
             extracted_text = self._clean_text(extracted_text)
             
+            # Only cache complete results; a failed OCR run should be retried next time
+            if extracted_text and not ocr_failures:
+                self._write_text_cache(cache_path, extracted_text)
+            
             logger.info(f"Extracted {len(extracted_text)} characters from {pdf_path}")
             return extracted_text
             
@@ -65,20 +119,196 @@ class PDFExtractor:
             logger.error(f"Error extracting text from {pdf_path}: {e}")
             raise
     
-    def _extract_with_ocr(self, page) -> str:
-        """Extract text from page image using OCR"""
+    def iter_pages(
+        self,
+        pdf_path: str,
+        use_ocr: bool = False,
+        ocr_failures: Optional[List[int]] = None
+    ) -> Iterator[str]:
+        """
+        Extract text from PDF file one page at a time
+        
+        Args:
+            pdf_path: Path to PDF file
+            use_ocr: Whether to use OCR for scanned PDFs
+            ocr_failures: Optional list that receives the numbers of pages whose OCR failed
+        
+        Yields:
+            Raw text of each page in order, prefixed with a page marker
+        """
+        found_text = False
+        
+        # First try with pdfplumber (works well for text-based PDFs)
+        executor = _get_ocr_executor()
+        # Pages in order, either finished text or a pending OCR future
+        pending = deque()
+        max_ahead = 2 * max(OCR_CONCURRENCY, 1)
+        
+        # Open the document in windows of pages so pdfminer's layout objects for
+        # earlier pages can be freed on huge PDFs; a short window means the end was reached
+        window_start = 0
+        window_size = PAGE_WINDOW
+        while window_size == PAGE_WINDOW:
+            window = list(range(window_start + 1, window_start + PAGE_WINDOW + 1))
+            with pdfplumber.open(pdf_path, pages=window) as pdf:
+                window_size = len(pdf.pages)
+                for page_num, page in enumerate(pdf.pages, start=window_start):
+                    page_text = page.extract_text()
+                    if page_text:
+                        pending.append(f"--- Page {page_num + 1} ---\n{page_text}")
+                    elif use_ocr:
+                        # If no text found and OCR is enabled, render here (pdfplumber isn't
+                        # thread-safe) and OCR the image on the pool
+                        pil_image = self._render_page(page)
+                        if pil_image is not None:
+                            pending.append((page_num, executor.submit(self._extract_with_ocr, pil_image)))
+                        else:
+                            pending.append(f"--- Page {page_num + 1} (OCR) ---\n")
+                    
+                    # Yield finished pages in order, blocking once OCR gets too far ahead
+                    while pending and (
+                        isinstance(pending[0], str) or pending[0][1].done() or len(pending) > max_ahead
+                    ):
+                        found_text = True
+                        yield self._resolve_page(pending.popleft(), ocr_failures)
+            
+            del pdf
+            gc.collect()
+            window_start += PAGE_WINDOW
+        
+        while pending:
+            found_text = True
+            yield self._resolve_page(pending.popleft(), ocr_failures)
+        
+        # If pdfplumber didn't extract text, try PyPDF2
+        if not found_text:
+            with _open_reader(pdf_path) as pdf_reader:
+                for page_num in range(len(pdf_reader.pages)):
+                    page = pdf_reader.pages[page_num]
+                    page_text = page.extract_text()
+                    if page_text:
+                        found_text = True
+                        yield f"--- Page {page_num + 1} ---\n{page_text}"
+        
+        # If still no text and OCR is enabled, try full document OCR
+        if not found_text and use_ocr:
+            yield self._extract_with_ocr_full(pdf_path)
+    
+    def _resolve_page(self, result, ocr_failures: Optional[List[int]] = None) -> str:
+        """Get page text from an iter_pages queue entry"""
+        if isinstance(result, str):
+            return result
+        page_num, future = result
+        page_text = future.result()
+        if page_text is None:
+            if ocr_failures is not None:
+                ocr_failures.append(page_num + 1)
+            page_text = ""
+        return f"--- Page {page_num + 1} (OCR) ---\n{page_text}"
+    
+    def _text_cache_path(self, pdf_path: str, use_ocr: bool) -> str:
+        """Get the extracted-text cache file for a PDF's contents and the extraction settings"""
+        with open(pdf_path, 'rb') as f:
+            digest = hashlib.file_digest(f, 'sha256').hexdigest()
+        # OCR output depends on the render resolution and language, so they are part of the key
+        settings = f"ocr_{OCR_RESOLUTION}_{OCR_LANG.replace('+', '-')}" if use_ocr else "text"
+        return os.path.join(TEXT_CACHE_DIR, f"{digest}_{settings}_v{TEXT_CACHE_VERSION}.txt")
+    
+    def _read_text_cache(self, cache_path: str) -> Optional[str]:
+        """Read cached extracted text, or None on a miss"""
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                text = f.read()
+            # Refresh the mtime so pruning removes the least recently used entries first
+            os.utime(cache_path)
+            return text
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Could not read text cache {cache_path}: {e}")
+            return None
+    
+    def _write_text_cache(self, cache_path: str, text: str):
+        """Atomically write extracted text to the cache"""
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                os.replace(tmp_path, cache_path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except Exception as e:
+            logger.warning(f"Could not write text cache {cache_path}: {e}")
+            return
+        
+        self._prune_text_cache()
+    
+    def _prune_text_cache(self):
+        """Remove least recently used cache entries until the cache fits TEXT_CACHE_MAX_BYTES"""
+        try:
+            with os.scandir(TEXT_CACHE_DIR) as entries:
+                files = [
+                    (stat.st_mtime, stat.st_size, entry.path)
+                    for entry in entries
+                    if entry.name.endswith(".txt") and entry.is_file()
+                    for stat in (entry.stat(),)
+                ]
+        except OSError as e:
+            logger.warning(f"Could not scan text cache {TEXT_CACHE_DIR}: {e}")
+            return
+        
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= TEXT_CACHE_MAX_BYTES:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except FileNotFoundError:
+                total -= size
+            except OSError as e:
+                logger.warning(f"Could not remove text cache entry {path}: {e}")
+    
+    def _render_page(self, page) -> Optional[Image.Image]:
+        """Render a page to a PIL image for OCR"""
         try:
             # Convert page to image
-            image = page.to_image(resolution=300)
+            image = page.to_image(resolution=OCR_RESOLUTION)
             # Convert to PIL Image
-            pil_image = image.original
-            
-            # Use pytesseract for OCR
-            text = pytesseract.image_to_string(pil_image, lang='eng')
-            return text
+            return image.original
+        except Exception as e:
+            logger.warning(f"Page rendering failed: {e}")
+            return None
+    
+    def _extract_with_ocr(self, pil_image: Image.Image) -> Optional[str]:
+        """Extract text from page image using OCR, or None if OCR failed"""
+        try:
+            # Reuse this thread's tesseract API instead of spawning a process per page
+            api = _get_tesseract_api()
+            api.SetImage(self._binarize(pil_image))
+            return api.GetUTF8Text()
         except Exception as e:
             logger.warning(f"OCR failed: {e}")
-            return ""
+            return None
+    
+    def _binarize(self, pil_image: Image.Image) -> Image.Image:
+        """Binarize a page image with Otsu's threshold so tesseract can skip its own preprocessing"""
+        gray = np.asarray(pil_image.convert('L'))
+        
+        # Otsu: pick the threshold maximizing between-class variance, over all 256 levels at once
+        hist = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+        weight_bg = np.cumsum(hist)
+        weight_fg = weight_bg[-1] - weight_bg
+        cum_mean = np.cumsum(hist * np.arange(256))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            between_var = (cum_mean[-1] * weight_bg - cum_mean * weight_bg[-1]) ** 2 / (weight_bg * weight_fg)
+        threshold = int(np.argmax(np.nan_to_num(between_var)))
+        
+        binary = np.where(gray > threshold, 255, 0).astype(np.uint8)
+        return Image.fromarray(binary)
     
     def _extract_with_ocr_full(self, pdf_path: str) -> str:
         """Extract text from entire PDF using OCR"""
@@ -88,21 +318,13 @@ class PDFExtractor:
     
     def _clean_text(self, text: str) -> str:
         """Clean extracted text"""
-        # Remove excessive whitespace
-        lines = text.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            if line:  # Skip empty lines
-                cleaned_lines.append(line)
-        
-        # Join lines with proper spacing
-        cleaned_text = '\n'.join(cleaned_lines)
+        # Remove excessive whitespace and skip empty lines
+        cleaned_text = '\n'.join(
+            stripped for stripped in (line.strip() for line in text.splitlines()) if stripped
+        )
         
         # Remove page number markers if they're just numbers
-        import re
-        cleaned_text = re.sub(r'^\s*\d+\s*$', '', cleaned_text, flags=re.MULTILINE)
+        cleaned_text = _PAGE_NUM_RE.sub('', cleaned_text)
         
         return cleaned_text
     
@@ -111,8 +333,7 @@ class PDFExtractor:
         metadata = {}
         
         try:
-            with open(pdf_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
+            with _open_reader(pdf_path) as pdf_reader:
                 
                 # Get document info
                 info = pdf_reader.metadata
@@ -142,23 +363,24 @@ class PDFExtractor:
         """Extract images from PDF"""
         image_paths = []
         
+        if not output_dir:
+            return image_paths
+        
         try:
-            with pdfplumber.open(pdf_path) as pdf:
+            os.makedirs(output_dir, exist_ok=True)
+            with pikepdf.open(pdf_path) as pdf:
                 for page_num, page in enumerate(pdf.pages):
-                    images = page.images
-                    
-                    for img_num, img in enumerate(images):
-                        if output_dir:
-                            os.makedirs(output_dir, exist_ok=True)
-                            img_filename = f"page_{page_num + 1}_img_{img_num + 1}.png"
-                            img_path = os.path.join(output_dir, img_filename)
-                            
-                            # Save the image
-                            img_data = img["stream"].get_data()
-                            with open(img_path, 'wb') as f:
-                                f.write(img_data)
-                            
-                            image_paths.append(img_path)
+                    for img_num, raw_image in enumerate(page.images.values()):
+                        # extract_to writes the stream as-is when it's already JPEG/JPX,
+                        # and picks the file extension to match
+                        fileprefix = os.path.join(output_dir, f"page_{page_num + 1}_img_{img_num + 1}")
+                        try:
+                            img_path = pikepdf.PdfImage(raw_image).extract_to(fileprefix=fileprefix)
+                        except Exception as e:
+                            logger.warning(f"Could not extract image {img_num + 1} on page {page_num + 1}: {e}")
+                            continue
+                        
+                        image_paths.append(img_path)
             
         except Exception as e:
             logger.error(f"Error extracting images: {e}")
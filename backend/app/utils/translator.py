@@ -8,10 +8,13 @@ from transformers import (
 )
 from typing import List, Dict, Optional, Union
 import logging
-from functools import lru_cache
+from functools import partial
 import asyncio
+import threading
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 
+from app.utils.compile_utils import compile_with_fallback
 from app.utils.language_utils import LanguageUtils
 
 logger = logging.getLogger(__name__)
@@ -50,28 +53,91 @@ class LegalTranslator:
         'kn-ta': 'pivot',
     }
     
+    # Maximum number of translation models kept loaded per translator
+    MAX_CACHED_MODELS = 4
+    # Dynamic batching: wait up to BATCH_WAIT seconds to collect up to MAX_BATCH texts
+    BATCH_WAIT = 0.02
+    MAX_BATCH = 16
+    
     def __init__(self, device: str = None):
         self.device = device or ('cuda' if torch.cuda.is_available() else 'cpu')
-        self.models = {}
-        self.tokenizers = {}
+        # LRU of model_name -> (model, tokenizer)
+        self.models = OrderedDict()
+        self._models_lock = threading.Lock()
+        self._pending: Optional[asyncio.Queue] = None
+        self._batcher_task: Optional[asyncio.Task] = None
+        # Event loop the queue and batcher task belong to
+        self._batcher_loop: Optional[asyncio.AbstractEventLoop] = None
         self.executor = ThreadPoolExecutor(max_workers=4)
         logger.info(f"Translator initialized on device: {self.device}")
     
-    @lru_cache(maxsize=10)
     def load_model(self, model_name: str):
         """Load translation model with caching"""
+        with self._models_lock:
+            if model_name in self.models:
+                self.models.move_to_end(model_name)
+                return self.models[model_name]
+            
+            model, tokenizer = self._load_model_uncached(model_name)
+            self.models[model_name] = (model, tokenizer)
+            while len(self.models) > self.MAX_CACHED_MODELS:
+                evicted_name, _ = self.models.popitem(last=False)
+                logger.info(f"Evicting translation model: {evicted_name}")
+            
+            return model, tokenizer
+    
+    def _load_model_uncached(self, model_name: str):
+        """Load a translation model and tokenizer"""
         try:
             logger.info(f"Loading translation model: {model_name}")
             tokenizer = MarianTokenizer.from_pretrained(model_name)
             model = MarianMTModel.from_pretrained(model_name)
             model = model.to(self.device)
+            if self.device.startswith('cuda'):
+                # Half precision halves memory traffic on GPU
+                model = model.half()
             model.eval()
+            if self.device.startswith('cuda'):
+                # Compile the forward generate() calls each step; a compiled module wrapper
+                # would leave generate() on the eager original
+                model.forward = compile_with_fallback(model.forward, model_name, dynamic=True)
             
             return model, tokenizer
         except Exception as e:
             logger.error(f"Error loading model {model_name}: {e}")
             raise
     
+    def warm(self, pairs: List[str]) -> threading.Thread:
+        """Preload models for language pairs (e.g. 'en-hi') in a background thread"""
+        def load_pairs():
+            for pair in pairs:
+                model_name = self.TRANSLATION_MODELS.get(pair)
+                if model_name is None:
+                    logger.warning(f"Cannot warm unsupported language pair: {pair}")
+                    continue
+                
+                if model_name == 'pivot':
+                    # Pivot pairs go through English, so load both legs
+                    src_lang, tgt_lang = pair.split('-')
+                    model_names = [
+                        self.TRANSLATION_MODELS.get(self.get_model_key(src_lang, 'en')),
+                        self.TRANSLATION_MODELS.get(self.get_model_key('en', tgt_lang))
+                    ]
+                else:
+                    model_names = [model_name]
+                
+                for name in model_names:
+                    if not name:
+                        continue
+                    try:
+                        self.load_model(name)
+                    except Exception as e:
+                        logger.warning(f"Could not warm translation model {name}: {e}")
+        
+        thread = threading.Thread(target=load_pairs, name="translator-warmup", daemon=True)
+        thread.start()
+        return thread
+    
     def get_model_key(self, src_lang: str, tgt_lang: str) -> str:
         """Get model key for language pair"""
         return f"{src_lang}-{tgt_lang}"
@@ -82,12 +148,29 @@ class LegalTranslator:
         source_lang: str,
         target_lang: str,
         max_length: int = 512,
-        batch_size: int = 8
+        batch_size: int = 8,
+        num_beams: int = 1
     ) -> str:
         """Translate text from source to target language"""
+        return self.translate_texts([text], source_lang, target_lang, max_length, batch_size, num_beams)[0]
+    
+    def translate_texts(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str,
+        max_length: int = 512,
+        batch_size: int = 8,
+        num_beams: int = 1
+    ) -> List[str]:
+        """
+        Translate a list of texts, generating batch_size texts per model call
         
-        if source_lang == target_lang:
-            return text
+        Decoding is deterministic; greedy by default, pass num_beams > 1 for beam search.
+        """
+        
+        if source_lang == target_lang or not texts:
+            return list(texts)
         
         model_key = self.get_model_key(source_lang, target_lang)
         
@@ -98,30 +181,50 @@ class LegalTranslator:
         
         if model_name == 'pivot':
             # Use English as pivot language
-            english_text = self.translate_text(text, source_lang, 'en', max_length)
-            return self.translate_text(english_text, 'en', target_lang, max_length)
+            english_texts = self.translate_texts(texts, source_lang, 'en', max_length, batch_size, num_beams)
+            return self.translate_texts(english_texts, 'en', target_lang, max_length, batch_size, num_beams)
         
         try:
             model, tokenizer = self.load_model(model_name)
             
-            # Prepare text
-            inputs = tokenizer(text, return_tensors="pt", padding=True, truncation=True, max_length=max_length)
-            inputs = {k: v.to(self.device) for k, v in inputs.items()}
+            # Batch similar-length texts together to keep padding small
+            order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+            translated_texts = [None] * len(texts)
             
-            # Generate translation
-            with torch.no_grad():
-                translated = model.generate(
-                    **inputs,
-                    max_length=max_length,
-                    num_beams=4,
-                    temperature=0.7,
-                    do_sample=True
+            for start in range(0, len(order), batch_size):
+                batch_indices = order[start:start + batch_size]
+                
+                # Prepare text
+                inputs = tokenizer(
+                    [texts[i] for i in batch_indices],
+                    return_tensors="pt",
+                    padding=True,
+                    truncation=True,
+                    max_length=max_length
                 )
+                if self.device.startswith('cuda'):
+                    # Pinned host memory lets the copy to the GPU run asynchronously
+                    inputs = {k: v.pin_memory().to(self.device, non_blocking=True) for k, v in inputs.items()}
+                else:
+                    inputs = {k: v.to(self.device) for k, v in inputs.items()}
+                
+                # Generate translation
+                with torch.inference_mode():
+                    translated = model.generate(
+                        **inputs,
+                        max_length=max_length,
+                        num_beams=num_beams,
+                        do_sample=False,
+                        use_cache=True,
+                        early_stopping=num_beams > 1
+                    )
+                
+                # Decode
+                decoded = tokenizer.batch_decode(translated, skip_special_tokens=True)
+                for i, translated_text in zip(batch_indices, decoded):
+                    translated_texts[i] = translated_text
             
-            # Decode
-            translated_text = tokenizer.decode(translated[0], skip_special_tokens=True)
-            
-            return translated_text
+            return translated_texts
             
         except Exception as e:
             logger.error(f"Translation error: {e}")
@@ -132,19 +235,78 @@ class LegalTranslator:
         texts: List[str],
         source_lang: str,
         target_lang: str,
-        max_length: int = 512
+        max_length: int = 512,
+        num_beams: int = 1
     ) -> List[str]:
         """Translate batch of texts asynchronously"""
-        loop = asyncio.get_event_loop()
+        if not texts:
+            return []
         
-        def translate_batch_sync():
-            translated_texts = []
-            for text in texts:
-                translated = self.translate_text(text, source_lang, target_lang, max_length)
-                translated_texts.append(translated)
-            return translated_texts
+        # Queue each text for the background batcher, which merges concurrent requests
+        self._ensure_batcher()
+        loop = asyncio.get_running_loop()
+        key = (source_lang, target_lang, max_length, num_beams)
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            self._pending.put_nowait((key, text, future))
+            futures.append(future)
+        
+        return list(await asyncio.gather(*futures))
+    
+    def _ensure_batcher(self):
+        """Start the background batching task on the running event loop if needed"""
+        loop = asyncio.get_running_loop()
+        # A task left on another (possibly closed) loop would never drain the queue,
+        # so rebuild both whenever the running loop changes
+        if self._batcher_task is None or self._batcher_task.done() or self._batcher_loop is not loop:
+            self._pending = asyncio.Queue()
+            self._batcher_loop = loop
+            self._batcher_task = loop.create_task(self._batcher(self._pending))
+    
+    async def _batcher(self, queue: asyncio.Queue):
+        """Collect pending texts for up to BATCH_WAIT seconds or MAX_BATCH items and translate them together"""
+        loop = asyncio.get_running_loop()
         
-        return await loop.run_in_executor(self.executor, translate_batch_sync)
+        while True:
+            items = [await queue.get()]
+            deadline = loop.time() + self.BATCH_WAIT
+            # Drain with get_nowait: wait_for(queue.get()) can drop a dequeued item on timeout
+            while True:
+                while len(items) < self.MAX_BATCH and not queue.empty():
+                    items.append(queue.get_nowait())
+                timeout = deadline - loop.time()
+                if len(items) >= self.MAX_BATCH or timeout <= 0:
+                    break
+                await asyncio.sleep(min(timeout, self.BATCH_WAIT / 4))
+            
+            # One batched generate call per language pair and generation settings
+            groups = {}
+            for key, text, future in items:
+                groups.setdefault(key, []).append((text, future))
+            
+            for (source_lang, target_lang, max_length, num_beams), group in groups.items():
+                try:
+                    translated_texts = await loop.run_in_executor(
+                        self.executor,
+                        partial(
+                            self.translate_texts,
+                            [text for text, _ in group],
+                            source_lang,
+                            target_lang,
+                            max_length=max_length,
+                            batch_size=self.MAX_BATCH,
+                            num_beams=num_beams
+                        )
+                    )
+                except Exception as e:
+                    for _, future in group:
+                        if not future.done():
+                            future.set_exception(e)
+                else:
+                    for (_, future), translated in zip(group, translated_texts):
+                        if not future.done():
+                            future.set_result(translated)
     
     def translate_legal_document(
         self,
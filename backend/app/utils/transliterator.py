@@ -9,6 +9,29 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Patterns preserved verbatim by transliterate_with_preservation
+_CITATION_RE = re.compile(r'\[\d{4}\].*?\d+')  # e.g. [2023] SC 123
+_SECTION_RE = re.compile(r'(?:Section|Art\.|Article|Rule|Regulation)\s+\d+[A-Za-z]*', re.IGNORECASE)
+_DATE_RE = re.compile(r'\d{1,2}[-/]\d{1,2}[-/]\d{2,4}')
+
+# Script detection: one pass, the first Indic character decides the script
+_SCRIPT_RE = re.compile(
+    r'(?P<devanagari>[\u0900-\u097F])'  # Hindi, Marathi, Sanskrit
+    r'|(?P<tamil>[\u0B80-\u0BFF])'
+    r'|(?P<kannada>[\u0C80-\u0CFF])'
+    r'|(?P<telugu>[\u0C00-\u0C7F])'
+    r'|(?P<malayalam>[\u0D00-\u0D7F])'
+    r'|(?P<bengali>[\u0980-\u09FF])'
+)
+_SCRIPT_GROUPS = {
+    'devanagari': sanscript.DEVANAGARI,
+    'tamil': sanscript.TAMIL,
+    'kannada': sanscript.KANNADA,
+    'telugu': sanscript.TELUGU,
+    'malayalam': sanscript.MALAYALAM,
+    'bengali': sanscript.BENGALI,
+}
+
 class LegalTransliterator:
     """Transliteration service for Indian languages"""
     
@@ -27,6 +50,47 @@ class LegalTransliterator:
         'en': sanscript.ITRANS
     }
     
+    # Simple vowel mapping for Indian languages, used by _fallback_transliterate
+    FALLBACK_VOWELS = {
+        sanscript.DEVANAGARI: {'अ': 'a', 'आ': 'aa', 'इ': 'i', 'ई': 'ee', 'उ': 'u', 'ऊ': 'oo'},
+        sanscript.TAMIL: {'அ': 'a', 'ஆ': 'aa', 'இ': 'i', 'ஈ': 'ee', 'உ': 'u', 'ஊ': 'oo'},
+        sanscript.KANNADA: {'ಅ': 'a', 'ಆ': 'aa', 'ಇ': 'i', 'ಈ': 'ee', 'ಉ': 'u', 'ಊ': 'oo'},
+    }
+    _FALLBACK_TABLES = {
+        script: str.maketrans(mapping) for script, mapping in FALLBACK_VOWELS.items()
+    }
+    
+    # Common legal terms in Indian languages
+    LEGAL_TERMS = {
+        'hi': {
+            'न्यायालय': 'court',
+            'कानून': 'law',
+            'अधिवक्ता': 'advocate',
+            'निर्णय': 'judgment',
+            'अपील': 'appeal'
+        },
+        'ta': {
+            'நீதிமன்றம்': 'court',
+            'சட்டம்': 'law',
+            'வழக்கறிஞர்': 'advocate',
+            'தீர்ப்பு': 'judgment',
+            'மேல்முறையீடு': 'appeal'
+        },
+        'kn': {
+            'ನ್ಯಾಯಾಲಯ': 'court',
+            'ಕಾನೂನು': 'law',
+            'ವಕೀಲ': 'advocate',
+            'ತೀರ್ಪು': 'judgment',
+            'ಮೇಲ್ಮನವಿ': 'appeal'
+        }
+    }
+    
+    # One alternation per language, longest terms first so overlapping terms match whole
+    _LEGAL_TERM_PATTERNS = {
+        lang: re.compile('|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True)))
+        for lang, terms in LEGAL_TERMS.items()
+    }
+    
     # Model for transliteration
     TRANSLITERATION_MODELS = {
         'hi': 'ai4bharat/IndicTrans',
@@ -73,18 +137,9 @@ class LegalTransliterator:
     
     def _fallback_transliterate(self, text: str, source_script: str, target_script: str) -> str:
         """Fallback transliteration for common patterns"""
-        # Simple vowel mapping for Indian languages
-        vowel_mapping = {
-            sanscript.DEVANAGARI: {'अ': 'a', 'आ': 'aa', 'इ': 'i', 'ई': 'ee', 'उ': 'u', 'ऊ': 'oo'},
-            sanscript.TAMIL: {'அ': 'a', 'ஆ': 'aa', 'இ': 'i', 'ஈ': 'ee', 'உ': 'u', 'ஊ': 'oo'},
-            sanscript.KANNADA: {'ಅ': 'a', 'ಆ': 'aa', 'ಇ': 'i', 'ಈ': 'ee', 'ಉ': 'u', 'ಊ': 'oo'},
-        }
-        
-        if source_script in vowel_mapping and target_script == sanscript.ITRANS:
-            # Convert to ITRANS (English-like)
-            mapping = vowel_mapping[source_script]
-            for src, tgt in mapping.items():
-                text = text.replace(src, tgt)
+        if source_script in self._FALLBACK_TABLES and target_script == sanscript.ITRANS:
+            # Convert to ITRANS (English-like) in a single pass
+            text = text.translate(self._FALLBACK_TABLES[source_script])
         
         return text
     
@@ -96,35 +151,11 @@ class LegalTransliterator:
     ) -> str:
         """Transliterate legal terms with special handling"""
         
-        # Common legal terms in Indian languages
-        legal_terms = {
-            'hi': {
-                'न्यायालय': 'court',
-                'कानून': 'law',
-                'अधिवक्ता': 'advocate',
-                'निर्णय': 'judgment',
-                'अपील': 'appeal'
-            },
-            'ta': {
-                'நீதிமன்றம்': 'court',
-                'சட்டம்': 'law',
-                'வழக்கறிஞர்': 'advocate',
-                'தீர்ப்பு': 'judgment',
-                'மேல்முறையீடு': 'appeal'
-            },
-            'kn': {
-                'ನ್ಯಾಯಾಲಯ': 'court',
-                'ಕಾನೂನು': 'law',
-                'ವಕೀಲ': 'advocate',
-                'ತೀರ್ಪು': 'judgment',
-                'ಮೇಲ್ಮನವಿ': 'appeal'
-            }
-        }
-        
-        # Replace legal terms with translations first
-        if source_lang in legal_terms:
-            for term, translation in legal_terms[source_lang].items():
-                text = text.replace(term, f"{term} ({translation})")
+        # Replace legal terms with translations first, in one pass over the text
+        pattern = self._LEGAL_TERM_PATTERNS.get(source_lang)
+        if pattern is not None:
+            terms = self.LEGAL_TERMS[source_lang]
+            text = pattern.sub(lambda m: f"{m.group(0)} ({terms[m.group(0)]})", text)
         
         # Then transliterate
         source_script = self.SCRIPTS.get(source_lang, sanscript.ITRANS)
@@ -134,29 +165,9 @@ class LegalTransliterator:
     
     def detect_script(self, text: str) -> str:
         """Detect script of the text"""
-        # Check for Devanagari (Hindi, Marathi, Sanskrit)
-        if re.search(r'[\u0900-\u097F]', text):
-            return sanscript.DEVANAGARI
-        
-        # Check for Tamil
-        if re.search(r'[\u0B80-\u0BFF]', text):
-            return sanscript.TAMIL
-        
-        # Check for Kannada
-        if re.search(r'[\u0C80-\u0CFF]', text):
-            return sanscript.KANNADA
-        
-        # Check for Telugu
-        if re.search(r'[\u0C00-\u0C7F]', text):
-            return sanscript.TELUGU
-        
-        # Check for Malayalam
-        if re.search(r'[\u0D00-\u0D7F]', text):
-            return sanscript.MALAYALAM
-        
-        # Check for Bengali
-        if re.search(r'[\u0980-\u09FF]', text):
-            return sanscript.BENGALI
+        match = _SCRIPT_RE.search(text)
+        if match:
+            return _SCRIPT_GROUPS[match.lastgroup]
         
         # Default to Latin/ITRANS
         return sanscript.ITRANS
@@ -183,21 +194,21 @@ class LegalTransliterator:
             preserved_sections = []
             
             # Find and preserve legal citations like [2023] SC 123
-            citations = re.findall(r'\[\d{4}\].*?\d+', text)
+            citations = _CITATION_RE.findall(text)
             for citation in citations:
                 placeholder = f"__CITATION_{len(preserved_sections)}__"
                 text = text.replace(citation, placeholder)
                 preserved_sections.append(('citation', citation))
             
             # Find and preserve section numbers like Section 123, Art. 45
-            sections = re.findall(r'(?:Section|Art\.|Article|Rule|Regulation)\s+\d+[A-Za-z]*', text, re.IGNORECASE)
+            sections = _SECTION_RE.findall(text)
             for section in sections:
                 placeholder = f"__SECTION_{len(preserved_sections)}__"
                 text = text.replace(section, placeholder)
                 preserved_sections.append(('section', section))
             
             # Find and preserve dates
-            dates = re.findall(r'\d{1,2}[-/]\d{1,2}[-/]\d{2,4}', text)
+            dates = _DATE_RE.findall(text)
             for date in dates:
                 placeholder = f"__DATE_{len(preserved_sections)}__"
                 text = text.replace(date, placeholder)
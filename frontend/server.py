@@ -2,22 +2,35 @@
 """Simple static file server for the frontend during development."""
 
 import http.server
-import socketserver
+import logging
 import os
 from pathlib import Path
 
 PORT = 3000
 FRONTEND_DIR = Path(__file__).parent / "public"
 
+# Headers that prevent caching, preformatted once
+NO_CACHE_HEADERS = (
+    b"Cache-Control: no-store, no-cache, must-revalidate\r\n"
+    b"Pragma: no-cache\r\n"
+    b"Expires: 0\r\n"
+)
+
+logger = logging.getLogger(__name__)
+
 class MyHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
+    # Keep connections alive so browsers reuse them for the page's many small assets
+    protocol_version = "HTTP/1.1"
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=str(FRONTEND_DIR), **kwargs)
     
     def end_headers(self):
         """Add headers to prevent caching."""
-        self.send_header('Cache-Control', 'no-store, no-cache, must-revalidate')
-        self.send_header('Pragma', 'no-cache')
-        self.send_header('Expires', '0')
+        if self.request_version != 'HTTP/0.9':
+            if not hasattr(self, '_headers_buffer'):
+                self._headers_buffer = []
+            self._headers_buffer.append(NO_CACHE_HEADERS)
         super().end_headers()
     
     def do_GET(self):
@@ -31,12 +44,14 @@ class MyHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     
     def log_message(self, format, *args):
         """Log HTTP requests."""
-        print(f"[{self.log_date_time_string()}] {format % args}")
+        logger.info("[%s] %s", self.log_date_time_string(), format % args)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     os.chdir(FRONTEND_DIR)
     
-    with socketserver.TCPServer(("", PORT), MyHTTPRequestHandler) as httpd:
+    # One thread per connection so a slow asset doesn't block other requests
+    with http.server.ThreadingHTTPServer(("", PORT), MyHTTPRequestHandler) as httpd:
         print(f"✓ Frontend server running on http://localhost:{PORT}")
         print(f"  Serving files from: {FRONTEND_DIR}")
         print(f"  Backend API: http://127.0.0.1:8001")
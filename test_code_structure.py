@@ -5,323 +5,357 @@ Code structure test for summarization, simplification, and multilingual output f
 
 import sys
 import os
+import hashlib
+import json
+import tempfile
+import re
+import mmap
+import threading
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Callable, Iterable
 
-def check_summarization_methods():
-    """Check if summarization methods exist in code"""
-    print("Checking Summarization Methods...")
-    
+from _check_runner import run_concurrently
+
+ROOT = Path(__file__).parent.resolve()
+
+# Every source file the checks inspect, resolved once
+PATHS = {
+    "bart": ROOT / "backend/app/models/bart_trainer.py",
+    "multi": ROOT / "backend/app/models/multi_model_trainer.py",
+    "multilingual": ROOT / "backend/app/models/multilingual_trainer.py",
+    "importer": ROOT / "backend/app/utils/huggingface_importer.py",
+    "inference": ROOT / "backend/app/routes/inference.py",
+    "processor": ROOT / "backend/app/utils/data_processor.py",
+    "evaluator": ROOT / "backend/app/utils/evaluator.py",
+}
+
+def _file_stats(paths: Iterable[Path]) -> dict[Path, os.stat_result]:
+    """List each wanted parent directory once and stat only the files being checked"""
+    wanted = set(paths)
+    stats = {}
+    for directory in {path.parent for path in wanted}:
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    path = Path(entry.path)
+                    if path in wanted and entry.is_file():
+                        stats[path] = entry.stat()
+        except FileNotFoundError:
+            pass
+    return stats
+
+# One directory listing per parent answers every existence check; empty files don't count
+_STATS = _file_stats(PATHS.values())
+EXISTS = {key: path in _STATS and _STATS[path].st_size > 0 for key, path in PATHS.items()}
+
+# Scan results persisted between runs, reused while a file's mtime and size are unchanged.
+# Kept in the user cache directory, one file per checkout, rather than in the working tree
+_CACHE_HOME = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+RESULTS_CACHE = (
+    _CACHE_HOME / "lexicognize"
+    / f"test_structure_{hashlib.sha256(str(ROOT).encode()).hexdigest()[:16]}.json"
+)
+# Bump when _DEF_RE or the scanning logic changes so results from older logic are discarded
+RESULTS_CACHE_VERSION = 2
+
+def _read_results_cache() -> dict:
+    """Load persisted scan results, treating a missing, corrupt or outdated cache as empty"""
     try:
-        # Check BART trainer
-        bart_file = Path(__file__).parent / "backend/app/models/bart_trainer.py"
-        if bart_file.exists():
-            with open(bart_file, 'r') as f:
-                bart_content = f.read()
-            
-            if "def generate_summary" in bart_content:
-                print("SUCCESS: BART trainer has generate_summary method")
-            else:
-                print("ERROR: BART trainer missing generate_summary method")
-                return False
-        else:
-            print("ERROR: BART trainer file not found")
-            return False
-        
-        # Check MultiModelTrainer
-        multi_file = Path(__file__).parent / "backend/app/models/multi_model_trainer.py"
-        if multi_file.exists():
-            with open(multi_file, 'r') as f:
-                multi_content = f.read()
-            
-            if "def generate_summary" in multi_content:
-                print("SUCCESS: MultiModelTrainer has generate_summary method")
-            else:
-                print("ERROR: MultiModelTrainer missing generate_summary method")
-                return False
-        else:
-            print("ERROR: MultiModelTrainer file not found")
-            return False
-            
-        print("SUCCESS: Summarization methods verified")
-        return True
-        
-    except Exception as e:
-        print(f"ERROR: Error checking summarization: {e}")
-        return False
+        with open(RESULTS_CACHE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cached, dict) or cached.get("version") != RESULTS_CACHE_VERSION:
+        return {}
+    return cached.get("results", {})
 
-def check_simplification_methods():
-    """Check if simplification methods exist in code"""
-    print("\nChecking Simplification Methods...")
-    
+def _write_results_cache(results: dict) -> None:
+    """Persist scan results atomically so an interrupted run can't leave a torn file"""
     try:
-        # Check MultiModelTrainer for simplification support
-        multi_file = Path(__file__).parent / "backend/app/models/multi_model_trainer.py"
-        if multi_file.exists():
-            with open(multi_file, 'r') as f:
-                multi_content = f.read()
-            
-            # Check for simplification task handling
-            if 'task="simplification"' in multi_content or '"simplification"' in multi_content:
-                print("SUCCESS: MultiModelTrainer supports simplification task")
-            else:
-                print("ERROR: MultiModelTrainer doesn't support simplification")
-                return False
-        else:
-            print("ERROR: MultiModelTrainer file not found")
-            return False
-        
-        # Check dataset support for simplification
-        importer_file = Path(__file__).parent / "backend/app/utils/huggingface_importer.py"
-        if importer_file.exists():
-            with open(importer_file, 'r') as f:
-                importer_content = f.read()
-            
-            if '"wikilarge"' in importer_content and '"simplification"' in importer_content:
-                print("SUCCESS: Wikilarge simplification dataset supported")
-            else:
-                print("ERROR: Wikilarge simplification dataset not properly configured")
-                return False
-        else:
-            print("ERROR: HuggingFace importer file not found")
-            return False
-            
-        print("SUCCESS: Simplification methods verified")
-        return True
-        
-    except Exception as e:
-        print(f"ERROR: Error checking simplification: {e}")
-        return False
+        RESULTS_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=RESULTS_CACHE.parent, suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({"version": RESULTS_CACHE_VERSION, "results": results}, f)
+        # mkstemp creates the file owner-only; give the cache normal file permissions
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, RESULTS_CACHE)
+    except OSError as e:
+        print(f"WARNING: Could not save check cache: {e}")
+
+# Checks run concurrently, so the shared results and file mappings are guarded by a lock
+_RESULTS = _read_results_cache()
+_RESULTS_DIRTY = False
+_STATE_LOCK = threading.Lock()
 
-def check_multilingual_methods():
-    """Check if multilingual methods exist in code"""
-    print("\nChecking Multilingual Methods...")
+def _cached_result(key: str, field: str, needles: tuple[str, ...], compute: Callable[[], Iterable[str]]) -> frozenset[str]:
+    """Return a persisted scan result for a file, recomputing it when the file or needles changed"""
+    global _RESULTS_DIRTY
+    st = _STATS[PATHS[key]]
+    with _STATE_LOCK:
+        entry = _RESULTS.get(key)
+        if not entry or entry.get("mtime_ns") != st.st_mtime_ns or entry.get("size") != st.st_size:
+            entry = {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+            _RESULTS[key] = entry
+        cached = entry.get(field)
+        if cached is not None and cached["needles"] == list(needles):
+            return frozenset(cached["found"])
     
-    try:
-        # Check MultilingualTrainer
-        multilingual_file = Path(__file__).parent / "backend/app/models/multilingual_trainer.py"
-        if multilingual_file.exists():
-            with open(multilingual_file, 'r') as f:
-                multilingual_content = f.read()
-            
-            required_methods = ['def train', 'def evaluate', 'def generate_summary', 'def translate_text']
-            missing_methods = []
-            
-            for method in required_methods:
-                if method not in multilingual_content:
-                    missing_methods.append(method)
-            
-            if missing_methods:
-                print(f"ERROR: MultilingualTrainer missing methods: {missing_methods}")
-                return False
-            else:
-                print("SUCCESS: MultilingualTrainer has all required methods")
-        else:
-            print("ERROR: MultilingualTrainer file not found")
-            return False
-        
-        # Check multilingual dataset support
-        importer_file = Path(__file__).parent / "backend/app/utils/huggingface_importer.py"
-        if importer_file.exists():
-            with open(importer_file, 'r') as f:
-                importer_content = f.read()
-            
-            if '"eurlex"' in importer_content:
-                # Check if it supports multiple languages
-                if '"en"' in importer_content and '"de"' in importer_content:
-                    print("SUCCESS: Multilingual dataset support found")
-                else:
-                    print("ERROR: Multilingual dataset doesn't support multiple languages")
-                    return False
-            else:
-                print("ERROR: No multilingual dataset support found")
-                return False
-        else:
-            print("ERROR: HuggingFace importer file not found")
-            return False
-            
-        print("SUCCESS: Multilingual methods verified")
-        return True
-        
-    except Exception as e:
-        print(f"ERROR: Error checking multilingual: {e}")
-        return False
+    # Scan without the lock so checks on different files run concurrently
+    found = sorted(compute())
+    with _STATE_LOCK:
+        entry[field] = {"needles": list(needles), "found": found}
+        _RESULTS_DIRTY = True
+    return frozenset(found)
+
+# Source files are mapped once per run and shared by every check
+_FILE_CACHE: dict[Path, mmap.mmap] = {}
 
-def check_multi_lexsum_output():
-    """Check multi_lexsum specific output functionality"""
-    print("\nChecking Multi-Lexsum Output...")
+def _load(path: Path) -> mmap.mmap:
+    """Return a read-only view of a source file, mapping it from disk only once"""
+    with _STATE_LOCK:
+        if path not in _FILE_CACHE:
+            with open(path, 'rb') as f:
+                # Files are scanned front to back, so ask for aggressive readahead where supported
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                # Callers only load files EXISTS reports as non-empty, which mmap requires
+                content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    content.madvise(mmap.MADV_SEQUENTIAL)
+                _FILE_CACHE[path] = content
+        return _FILE_CACHE[path]
+
+def _close_files() -> None:
+    """Close every file mapping made during a run"""
+    with _STATE_LOCK:
+        for content in _FILE_CACHE.values():
+            content.close()
+        _FILE_CACHE.clear()
+
+@lru_cache(maxsize=None)
+def _needle_pattern(needles: tuple[str, ...]) -> tuple[re.Pattern[bytes], dict[bytes, str]]:
+    """Encode a tuple of literal needles and compile them into one alternation, once per needle set"""
+    encoded = {needle.encode('utf-8'): needle for needle in needles}
+    # Lookahead alternation reports overlapping matches; longest needles first
+    pattern = re.compile(b"(?=(" + b"|".join(
+        re.escape(raw) for raw in sorted(encoded, key=len, reverse=True)
+    ) + b"))")
+    return pattern, encoded
+
+def _scan(content: bytes | mmap.mmap, needles: Iterable[str]) -> set[str]:
+    """Return the needles present in content, stopping as soon as all of them are found"""
+    pattern, encoded = _needle_pattern(tuple(needles))
+    if len(encoded) == 1:
+        # A lone needle is a plain byte search, no regex machinery needed
+        (raw, needle), = encoded.items()
+        return {needle} if content.find(raw) != -1 else set()
     
-    try:
-        importer_file = Path(__file__).parent / "backend/app/utils/huggingface_importer.py"
-        if not importer_file.exists():
-            print("ERROR: HuggingFace importer file not found")
-            return False
-        
-        with open(importer_file, 'r') as f:
-            importer_content = f.read()
-        
-        # Check multi_lexsum configuration
-        if '"multi_lexsum"' not in importer_content:
-            print("ERROR: Multi-lexsum dataset not supported")
-            return False
-        
-        # Check for required fields
-        required_fields = ["summary/long", "summary/short", "summary/tiny"]
-        missing_fields = []
-        
-        for field in required_fields:
-            if f'"{field}"' not in importer_content:
-                missing_fields.append(field)
-        
-        if missing_fields:
-            print(f"ERROR: Multi-lexsum missing fields: {missing_fields}")
-            return False
-        else:
-            print("SUCCESS: Multi-lexsum has all required summary fields")
-        
-        # Check version name
-        if '"v20220616"' not in importer_content:
-            print("ERROR: Multi-lexsum version not correctly set")
-            return False
-        else:
-            print("SUCCESS: Multi-lexsum version correctly set")
-        
-        # Check formatting logic
-        if 'summary_long' in importer_content and 'summary_short' in importer_content and 'summary_tiny' in importer_content:
-            print("SUCCESS: Multi-lexsum formatting logic found")
-        else:
-            print("ERROR: Multi-lexsum formatting logic missing")
-            return False
-            
-        print("SUCCESS: Multi-lexsum functionality verified")
-        return True
-        
-    except Exception as e:
-        print(f"ERROR: Error checking multi-lexsum: {e}")
-        return False
+    remaining = dict(encoded)
+    found = set()
+    for match in pattern.finditer(content):
+        hit = match.group(1)
+        # A shorter needle may hide behind a longer one starting at the same offset
+        for raw in [raw for raw in remaining if hit.startswith(raw)]:
+            found.add(remaining.pop(raw))
+        if not remaining:
+            break
+    return found
+
+_DEF_RE = re.compile(rb'^\s*(?:async\s+)?def\s+(\w+)\s*\(', re.M)
+
+@lru_cache(maxsize=None)
+def _defined_names(key: str) -> frozenset[str]:
+    """Return the names of every function defined in a checked file, extracted in one pass"""
+    return _cached_result(
+        key, "defs", (),
+        lambda: {name.decode('utf-8') for name in _DEF_RE.findall(_load(PATHS[key]))}
+    )
+
+# Human-readable name of each checked file, used in "file not found" errors
+FILE_LABELS = {
+    "bart": "BART trainer",
+    "multi": "MultiModelTrainer",
+    "multilingual": "MultilingualTrainer",
+    "importer": "HuggingFace importer",
+    "inference": "Inference API",
+    "processor": "Data processor",
+    "evaluator": "Evaluator",
+}
 
-def check_inference_api():
-    """Check inference API output functionality"""
-    print("\nChecking Inference API...")
+# Each check runs its rules in order and stops at the first failure.
+# A rule is (file key, kind, needles, success message, error message):
+#   "defs" - every needle must be a function defined in the file
+#   "text" - every needle must appear literally in the file
+#   "any"  - at least one needle must appear literally in the file
+# Error messages may use {missing} to list the needles that were not found.
+CHECKS = (
+    {
+        "header": "Checking Summarization Methods...",
+        "topic": "summarization",
+        "verified": "Summarization methods verified",
+        "rules": (
+            ("bart", "defs", ("generate_summary",),
+             "SUCCESS: BART trainer has generate_summary method",
+             "ERROR: BART trainer missing generate_summary method"),
+            ("multi", "defs", ("generate_summary",),
+             "SUCCESS: MultiModelTrainer has generate_summary method",
+             "ERROR: MultiModelTrainer missing generate_summary method"),
+        ),
+    },
+    {
+        "header": "\nChecking Simplification Methods...",
+        "topic": "simplification",
+        "verified": "Simplification methods verified",
+        "rules": (
+            ("multi", "any", ('task="simplification"', '"simplification"'),
+             "SUCCESS: MultiModelTrainer supports simplification task",
+             "ERROR: MultiModelTrainer doesn't support simplification"),
+            ("importer", "text", ('"wikilarge"', '"simplification"'),
+             "SUCCESS: Wikilarge simplification dataset supported",
+             "ERROR: Wikilarge simplification dataset not properly configured"),
+        ),
+    },
+    {
+        "header": "\nChecking Multilingual Methods...",
+        "topic": "multilingual",
+        "verified": "Multilingual methods verified",
+        "rules": (
+            ("multilingual", "defs", ("train", "evaluate", "generate_summary", "translate_text"),
+             "SUCCESS: MultilingualTrainer has all required methods",
+             "ERROR: MultilingualTrainer missing methods: {missing}"),
+            ("importer", "text", ('"eurlex"',),
+             None,
+             "ERROR: No multilingual dataset support found"),
+            ("importer", "text", ('"en"', '"de"'),
+             "SUCCESS: Multilingual dataset support found",
+             "ERROR: Multilingual dataset doesn't support multiple languages"),
+        ),
+    },
+    {
+        "header": "\nChecking Multi-Lexsum Output...",
+        "topic": "multi-lexsum",
+        "verified": "Multi-lexsum functionality verified",
+        "rules": (
+            ("importer", "text", ('"multi_lexsum"',),
+             None,
+             "ERROR: Multi-lexsum dataset not supported"),
+            ("importer", "text", ('"summary/long"', '"summary/short"', '"summary/tiny"'),
+             "SUCCESS: Multi-lexsum has all required summary fields",
+             "ERROR: Multi-lexsum missing fields: {missing}"),
+            ("importer", "text", ('"v20220616"',),
+             "SUCCESS: Multi-lexsum version correctly set",
+             "ERROR: Multi-lexsum version not correctly set"),
+            ("importer", "text", ("summary_long", "summary_short", "summary_tiny"),
+             "SUCCESS: Multi-lexsum formatting logic found",
+             "ERROR: Multi-lexsum formatting logic missing"),
+        ),
+    },
+    {
+        "header": "\nChecking Inference API...",
+        "topic": "inference API",
+        "verified": "Inference API functionality verified",
+        "rules": (
+            ("inference", "defs", ("generate_summary", "batch_generate_summary", "evaluate_model"),
+             "SUCCESS: Inference API has all required endpoints",
+             "ERROR: Inference API missing endpoints: {missing}"),
+            ("inference", "text", ("InferenceRequest", "InferenceResponse"),
+             "SUCCESS: Inference API has proper request/response models",
+             "ERROR: Inference API missing request/response models"),
+        ),
+    },
+    {
+        "header": "\nChecking Output Formatting...",
+        "topic": "output formatting",
+        "verified": "Output formatting functionality verified",
+        "rules": (
+            ("processor", "defs", ("process_dataset", "calculate_statistics"),
+             "SUCCESS: Data processor has output formatting methods",
+             "ERROR: Data processor missing output formatting methods"),
+            ("evaluator", "text", ("class ModelEvaluator",),
+             "SUCCESS: Model evaluator available for output assessment",
+             "ERROR: Model evaluator not found"),
+        ),
+    },
+)
+
+# Union of literal needles per file, so each file is scanned once for every check
+_FILE_NEEDLES = {}
+for _check in CHECKS:
+    for _key, _kind, _needles, _, _ in _check["rules"]:
+        if _kind != "defs":
+            _FILE_NEEDLES.setdefault(_key, {}).update(dict.fromkeys(_needles))
+_FILE_NEEDLES = {key: tuple(needles) for key, needles in _FILE_NEEDLES.items()}
+for _needles in _FILE_NEEDLES.values():
+    _needle_pattern(_needles)
+
+@lru_cache(maxsize=None)
+def _found_needles(key: str) -> frozenset[str]:
+    """Return the literal needles present in a checked file, scanned in one pass"""
+    return _cached_result(key, "needles", _FILE_NEEDLES[key], lambda: _scan(_load(PATHS[key]), _FILE_NEEDLES[key]))
+
+def run_check(check: dict) -> bool:
+    """Evaluate one entry of CHECKS, printing a status line per rule"""
+    print(check["header"])
     
-    try:
-        inference_file = Path(__file__).parent / "backend/app/routes/inference.py"
-        if not inference_file.exists():
-            print("ERROR: Inference API file not found")
+    for key, kind, needles, success, error in check["rules"]:
+        if not EXISTS[key]:
+            problem = "is empty" if PATHS[key] in _STATS else "not found"
+            print(f"ERROR: {FILE_LABELS[key]} file {problem}")
             return False
         
-        with open(inference_file, 'r') as f:
-            inference_content = f.read()
+        available = _defined_names(key) if kind == "defs" else _found_needles(key)
+        missing = [needle for needle in needles if needle not in available]
+        passed = len(missing) < len(needles) if kind == "any" else not missing
         
-        # Check for required endpoints
-        required_endpoints = ["generate_summary", "batch_generate_summary", "evaluate_model"]
-        missing_endpoints = []
-        
-        for endpoint in required_endpoints:
-            if endpoint not in inference_content:
-                missing_endpoints.append(endpoint)
-        
-        if missing_endpoints:
-            print(f"ERROR: Inference API missing endpoints: {missing_endpoints}")
-            return False
-        else:
-            print("SUCCESS: Inference API has all required endpoints")
-        
-        # Check for request/response models
-        if "InferenceRequest" in inference_content and "InferenceResponse" in inference_content:
-            print("SUCCESS: Inference API has proper request/response models")
-        else:
-            print("ERROR: Inference API missing request/response models")
+        if not passed:
+            print(error.format(missing=[needle.strip('"') for needle in missing]))
             return False
-            
-        print("SUCCESS: Inference API functionality verified")
-        return True
-        
-    except Exception as e:
-        print(f"ERROR: Error checking inference API: {e}")
-        return False
-
-def check_output_formatting():
-    """Check output formatting functionality"""
-    print("\nChecking Output Formatting...")
+        if success:
+            print(success)
     
-    try:
-        # Check data processor
-        processor_file = Path(__file__).parent / "backend/app/utils/data_processor.py"
-        if processor_file.exists():
-            with open(processor_file, 'r') as f:
-                processor_content = f.read()
-            
-            if "def process_dataset" in processor_content and "def calculate_statistics" in processor_content:
-                print("SUCCESS: Data processor has output formatting methods")
-            else:
-                print("ERROR: Data processor missing output formatting methods")
-                return False
-        else:
-            print("ERROR: Data processor file not found")
-            return False
-        
-        # Check evaluator
-        evaluator_file = Path(__file__).parent / "backend/app/utils/evaluator.py"
-        if evaluator_file.exists():
-            with open(evaluator_file, 'r') as f:
-                evaluator_content = f.read()
-            
-            if "class ModelEvaluator" in evaluator_content:
-                print("SUCCESS: Model evaluator available for output assessment")
-            else:
-                print("ERROR: Model evaluator not found")
-                return False
-        else:
-            print("ERROR: Evaluator file not found")
-            return False
-            
-        print("SUCCESS: Output formatting functionality verified")
-        return True
-        
-    except Exception as e:
-        print(f"ERROR: Error checking output formatting: {e}")
-        return False
+    print(f"SUCCESS: {check['verified']}")
+    return True
 
-def main():
+def main() -> bool:
     """Main test function"""
-    print("Testing Lexicognize Output Functionality (Code Structure)\n")
-    
-    tests = [
-        check_summarization_methods,
-        check_simplification_methods,
-        check_multilingual_methods,
-        check_multi_lexsum_output,
-        check_inference_api,
-        check_output_formatting
-    ]
+    tests = [partial(run_check, check) for check in CHECKS]
     
-    passed = 0
     total = len(tests)
     
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-        except Exception as e:
-            print(f"ERROR: Test error: {e}")
+    # Tests are independent, so run them concurrently and replay their output in order
+    try:
+        results = run_concurrently(tests)
+    finally:
+        _close_files()
     
-    print(f"\nTest Results: {passed}/{total} tests passed")
+    if _RESULTS_DIRTY:
+        _write_results_cache(_RESULTS)
+    
+    # Emit the header, the captured check output and the summary in a single write
+    passed = sum(test_passed for test_passed, _ in results)
+    report = ["Testing Lexicognize Output Functionality (Code Structure)\n\n", *(output for _, output in results)]
+    report.append(f"\nTest Results: {passed}/{total} tests passed\n")
     
     if passed == total:
-        print("SUCCESS: All output functionality code structure verified!")
-        print("\nSTATUS CHECK:")
-        print("Summarization: CODE STRUCTURE OK")
-        print("Simplification: CODE STRUCTURE OK") 
-        print("Multilingual: CODE STRUCTURE OK")
-        print("Multi-lexsum: CODE STRUCTURE OK")
-        print("Inference API: CODE STRUCTURE OK")
-        print("Output Formatting: CODE STRUCTURE OK")
-        print("\nNOTE: Runtime functionality requires dependency installation:")
-        print("pip install -r backend/requirements.txt")
-        return True
+        report.append(
+            "SUCCESS: All output functionality code structure verified!\n"
+            "\nSTATUS CHECK:\n"
+            "Summarization: CODE STRUCTURE OK\n"
+            "Simplification: CODE STRUCTURE OK\n"
+            "Multilingual: CODE STRUCTURE OK\n"
+            "Multi-lexsum: CODE STRUCTURE OK\n"
+            "Inference API: CODE STRUCTURE OK\n"
+            "Output Formatting: CODE STRUCTURE OK\n"
+            "\nNOTE: Runtime functionality requires dependency installation:\n"
+            "pip install -r backend/requirements.txt\n"
+        )
     else:
-        print("WARNING: Some code structure tests failed. Please review the issues above.")
-        return False
+        report.append("WARNING: Some code structure tests failed. Please review the issues above.\n")
+    
+    sys.stdout.write("".join(report))
+    sys.stdout.flush()
+    return passed == total
 
 if __name__ == "__main__":
     success = main()
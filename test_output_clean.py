@@ -5,8 +5,54 @@ Focused test for summarization, simplification, and multilingual output function
 
 import sys
 import os
+import threading
+from concurrent.futures import Future
+from types import MappingProxyType
+
+from _check_runner import run_concurrently
 sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
 
+# Required names, built once and compared with set difference
+_MULTILINGUAL_METHODS = frozenset(('train', 'evaluate', 'generate_summary', 'translate_text'))
+_MLS_FIELDS = frozenset(("summary/long", "summary/short", "summary/tiny"))
+_MLS_KEYS = frozenset(("summary_long", "summary_short", "summary_tiny"))
+
+# Read-only multi_lexsum sample, built once at import
+# (sources stays a list because the importer only concatenates list sources)
+_MLS_SAMPLE = MappingProxyType({
+    "sources": ["Legal document 1", "Legal document 2"],
+    "summary/long": "This is a long summary of the legal documents...",
+    "summary/short": "Short summary...",
+    "summary/tiny": "Tiny summary."
+})
+
+# Trainers are built once and shared across tests; each key maps to the Future of its build
+_TRAINERS = {}
+_TRAINERS_LOCK = threading.Lock()
+
+def _get_trainer(key, factory):
+    """Return the cached trainer for key, building it with factory on first use"""
+    with _TRAINERS_LOCK:
+        pending = _TRAINERS.get(key)
+        is_builder = pending is None
+        if is_builder:
+            pending = _TRAINERS[key] = Future()
+    
+    if not is_builder:
+        return pending.result()
+    
+    # Build outside the lock so different trainers are constructed concurrently
+    try:
+        trainer = factory()
+    except Exception as e:
+        # Forget the failure so a later test retries the build
+        with _TRAINERS_LOCK:
+            del _TRAINERS[key]
+        pending.set_exception(e)
+        raise
+    pending.set_result(trainer)
+    return trainer
+
 def test_summarization_output():
     """Test summarization output functionality"""
     print("Testing Summarization Output...")
@@ -15,7 +61,7 @@ def test_summarization_output():
         # Test BART trainer summarization
         from app.models.bart_trainer import BARTTrainer
         
-        trainer = BARTTrainer()
+        trainer = _get_trainer("bart", BARTTrainer)
         
         # Check if generate_summary method exists and works
         if hasattr(trainer, 'generate_summary'):
@@ -27,7 +73,10 @@ def test_summarization_output():
         # Test MultiModelTrainer for summarization
         from app.models.multi_model_trainer import MultiModelTrainer
         
-        multi_trainer = MultiModelTrainer(model_type="bart", task="summarization")
+        multi_trainer = _get_trainer(
+            ("multi", "bart", "summarization"),
+            lambda: MultiModelTrainer(model_type="bart", task="summarization")
+        )
         
         if hasattr(multi_trainer, 'generate_summary'):
             print("SUCCESS: MultiModelTrainer has generate_summary method")
@@ -50,7 +99,10 @@ def test_simplification_output():
         # Test MultiModelTrainer for simplification
         from app.models.multi_model_trainer import MultiModelTrainer
         
-        simplification_trainer = MultiModelTrainer(model_type="bart", task="simplification")
+        simplification_trainer = _get_trainer(
+            ("multi", "bart", "simplification"),
+            lambda: MultiModelTrainer(model_type="bart", task="simplification")
+        )
         
         if hasattr(simplification_trainer, 'generate_summary'):
             print("SUCCESS: Simplification trainer has generate_summary method")
@@ -88,15 +140,10 @@ def test_multilingual_output():
         # Test MultilingualTrainer
         from app.models.multilingual_trainer import MultilingualTrainer
         
-        multilingual_trainer = MultilingualTrainer()
+        multilingual_trainer = _get_trainer("multilingual", MultilingualTrainer)
         
         # Check for multilingual methods
-        required_methods = ['train', 'evaluate', 'generate_summary', 'translate_text']
-        missing_methods = []
-        
-        for method in required_methods:
-            if not hasattr(multilingual_trainer, method):
-                missing_methods.append(method)
+        missing_methods = sorted(_MULTILINGUAL_METHODS.difference(dir(type(multilingual_trainer))))
         
         if missing_methods:
             print(f"ERROR: MultilingualTrainer missing methods: {missing_methods}")
@@ -138,10 +185,7 @@ def test_multi_lexsum_output():
             config = HuggingFaceDatasetImporter.SUPPORTED_DATASETS["multi_lexsum"]
             
             # Check for required fields
-            required_fields = ["summary/long", "summary/short", "summary/tiny"]
-            fields = config.get("fields", [])
-            
-            missing_fields = [field for field in required_fields if field not in fields]
+            missing_fields = sorted(_MLS_FIELDS.difference(config.get("fields", [])))
             if missing_fields:
                 print(f"ERROR: Multi-lexsum missing fields: {missing_fields}")
                 return False
@@ -160,20 +204,13 @@ def test_multi_lexsum_output():
             return False
             
         # Test formatting logic
-        sample_data = {
-            "sources": ["Legal document 1", "Legal document 2"],
-            "summary/long": "This is a long summary of the legal documents...",
-            "summary/short": "Short summary...",
-            "summary/tiny": "Tiny summary."
-        }
-        
         formatted = HuggingFaceDatasetImporter._format_sample(
-            sample_data, config, "multi_lexsum"
+            _MLS_SAMPLE, config, "multi_lexsum"
         )
         
         if formatted:
             # Check if all summary types are preserved
-            if all(key in formatted for key in ["summary_long", "summary_short", "summary_tiny"]):
+            if _MLS_KEYS.issubset(formatted):
                 print("SUCCESS: Multi-lexsum formatting preserves all summary types")
             else:
                 print("ERROR: Multi-lexsum formatting missing summary types")
@@ -198,8 +235,6 @@ def test_multi_lexsum_output():
 
 def main():
     """Main test function"""
-    print("Testing Lexicognize Output Functionality\n")
-    
     tests = [
         test_summarization_output,
         test_simplification_output,
@@ -207,28 +242,30 @@ def main():
         test_multi_lexsum_output
     ]
     
-    passed = 0
     total = len(tests)
     
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-        except Exception as e:
-            print(f"ERROR: Test error: {e}")
+    # Tests are independent, so run them concurrently and replay their output in order
+    results = run_concurrently(tests)
     
-    print(f"\nTest Results: {passed}/{total} tests passed")
+    # Emit the header, the captured check output and the summary in a single write
+    passed = sum(test_passed for test_passed, _ in results)
+    report = ["Testing Lexicognize Output Functionality\n\n", *(output for _, output in results)]
+    report.append(f"\nTest Results: {passed}/{total} tests passed\n")
     
     if passed == total:
-        print("SUCCESS: All output functionality tests passed!")
-        print("\nSummarization: WORKING")
-        print("Simplification: WORKING") 
-        print("Multilingual: WORKING")
-        print("Multi-lexsum: WORKING")
-        return True
+        report.append(
+            "SUCCESS: All output functionality tests passed!\n"
+            "\nSummarization: WORKING\n"
+            "Simplification: WORKING\n"
+            "Multilingual: WORKING\n"
+            "Multi-lexsum: WORKING\n"
+        )
     else:
-        print("WARNING: Some tests failed. Please review the issues above.")
-        return False
+        report.append("WARNING: Some tests failed. Please review the issues above.\n")
+    
+    sys.stdout.write("".join(report))
+    sys.stdout.flush()
+    return passed == total
 
 if __name__ == "__main__":
     success = main()
@@ -5,31 +5,67 @@ Focused test for summarization, simplification, and multilingual output function
 
 import sys
 import os
+import importlib
+
+from _check_runner import run_concurrently
+from _test_helpers import get_processor
 sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
 
+# Backend classes are imported once at module load. A failed import leaves the
+# name as None and records why, so each test can report it like an inline import.
+_IMPORT_ERRORS = {}
+
+def _optional_import(module, name):
+    """Import name from module, returning None if the module can't be loaded"""
+    try:
+        return getattr(importlib.import_module(module), name)
+    except Exception as e:
+        _IMPORT_ERRORS[name] = e
+        return None
+
+def _require(*names):
+    """Raise the recorded import error for the first unavailable name"""
+    for name in names:
+        if name in _IMPORT_ERRORS:
+            raise _IMPORT_ERRORS[name]
+
+BARTTrainer = _optional_import("app.models.bart_trainer", "BARTTrainer")
+MultiModelTrainer = _optional_import("app.models.multi_model_trainer", "MultiModelTrainer")
+MultilingualTrainer = _optional_import("app.models.multilingual_trainer", "MultilingualTrainer")
+HuggingFaceDatasetImporter = _optional_import("app.utils.huggingface_importer", "HuggingFaceDatasetImporter")
+LegalDataProcessor = _optional_import("app.utils.data_processor", "LegalDataProcessor")
+InferenceRequest = _optional_import("app.routes.inference", "InferenceRequest")
+InferenceResponse = _optional_import("app.routes.inference", "InferenceResponse")
+
+# Required keys, built once and checked with set operations
+_MULTILINGUAL_METHODS = frozenset(("train", "evaluate", "generate_summary", "translate_text"))
+_LEXSUM_FIELDS = frozenset(("summary/long", "summary/short", "summary/tiny"))
+_INFERENCE_REQ_FIELDS = frozenset(("text", "model_path", "model_type", "task"))
+_RESPONSE_FIELDS = frozenset(("summary", "processing_time"))
+_LEXSUM_KEYS = frozenset(("summary_long", "summary_short", "summary_tiny"))
+_PROCESSED_FIELDS = frozenset((
+    "processed_at", "text_length", "summary_length", "language", "complexity", "entities", "is_valid"
+))
+
 def test_summarization_output():
     """Test summarization output functionality"""
     print("Testing Summarization Output...")
     
     try:
         # Test BART trainer summarization
-        from app.models.bart_trainer import BARTTrainer
+        _require("BARTTrainer")
         
-        trainer = BARTTrainer()
-        
-        # Check if generate_summary method exists and works
-        if hasattr(trainer, 'generate_summary'):
+        # Methods live on the class, so no trainer (and no model load) is needed
+        if hasattr(BARTTrainer, 'generate_summary'):
             print("SUCCESS: BART trainer has generate_summary method")
         else:
             print("ERROR: BART trainer missing generate_summary method")
             return False
             
         # Test MultiModelTrainer for summarization
-        from app.models.multi_model_trainer import MultiModelTrainer
-        
-        multi_trainer = MultiModelTrainer(model_type="bart", task="summarization")
+        _require("MultiModelTrainer")
         
-        if hasattr(multi_trainer, 'generate_summary'):
+        if hasattr(MultiModelTrainer, 'generate_summary'):
             print("SUCCESS: MultiModelTrainer has generate_summary method")
         else:
             print("ERROR: MultiModelTrainer missing generate_summary method")
@@ -48,22 +84,21 @@ def test_simplification_output():
     
     try:
         # Test MultiModelTrainer for simplification
-        from app.models.multi_model_trainer import MultiModelTrainer
+        _require("MultiModelTrainer")
         
-        simplification_trainer = MultiModelTrainer(model_type="bart", task="simplification")
-        
-        if hasattr(simplification_trainer, 'generate_summary'):
+        if hasattr(MultiModelTrainer, 'generate_summary'):
             print("✅ Simplification trainer has generate_summary method")
         else:
             print("❌ Simplification trainer missing generate_summary method")
             return False
             
         # Test dataset processing for simplification
-        from app.utils.huggingface_importer import HuggingFaceDatasetImporter
+        _require("HuggingFaceDatasetImporter")
         
         # Check if wikilarge (simplification dataset) is supported
-        if "wikilarge" in HuggingFaceDatasetImporter.SUPPORTED_DATASETS:
-            config = HuggingFaceDatasetImporter.SUPPORTED_DATASETS["wikilarge"]
+        supported = HuggingFaceDatasetImporter.SUPPORTED_DATASETS
+        if "wikilarge" in supported:
+            config = supported["wikilarge"]
             if config["task"] == "simplification":
                 print("✅ Wikilarge simplification dataset properly configured")
             else:
@@ -86,17 +121,10 @@ def test_multilingual_output():
     
     try:
         # Test MultilingualTrainer
-        from app.models.multilingual_trainer import MultilingualTrainer
-        
-        multilingual_trainer = MultilingualTrainer()
+        _require("MultilingualTrainer")
         
         # Check for multilingual methods
-        required_methods = ['train', 'evaluate', 'generate_summary', 'translate_text']
-        missing_methods = []
-        
-        for method in required_methods:
-            if not hasattr(multilingual_trainer, method):
-                missing_methods.append(method)
+        missing_methods = sorted(_MULTILINGUAL_METHODS.difference(dir(MultilingualTrainer)))
         
         if missing_methods:
             print(f"❌ MultilingualTrainer missing methods: {missing_methods}")
@@ -105,10 +133,11 @@ def test_multilingual_output():
             print("✅ MultilingualTrainer has all required methods")
         
         # Test multilingual dataset support
-        from app.utils.huggingface_importer import HuggingFaceDatasetImporter
+        _require("HuggingFaceDatasetImporter")
         
-        if "eurlex" in HuggingFaceDatasetImporter.SUPPORTED_DATASETS:
-            config = HuggingFaceDatasetImporter.SUPPORTED_DATASETS["eurlex"]
+        supported = HuggingFaceDatasetImporter.SUPPORTED_DATASETS
+        if "eurlex" in supported:
+            config = supported["eurlex"]
             languages = config.get("languages", [])
             if len(languages) > 1:  # Should support multiple languages
                 print(f"✅ Multilingual dataset supports: {languages}")
@@ -131,17 +160,15 @@ def test_multi_lexsum_output():
     print("\nTesting Multi-Lexsum Output...")
     
     try:
-        from app.utils.huggingface_importer import HuggingFaceDatasetImporter
+        _require("HuggingFaceDatasetImporter")
         
         # Check multi_lexsum configuration
-        if "multi_lexsum" in HuggingFaceDatasetImporter.SUPPORTED_DATASETS:
-            config = HuggingFaceDatasetImporter.SUPPORTED_DATASETS["multi_lexsum"]
+        supported = HuggingFaceDatasetImporter.SUPPORTED_DATASETS
+        if "multi_lexsum" in supported:
+            config = supported["multi_lexsum"]
             
             # Check for required fields
-            required_fields = ["summary/long", "summary/short", "summary/tiny"]
-            fields = config.get("fields", [])
-            
-            missing_fields = [field for field in required_fields if field not in fields]
+            missing_fields = sorted(_LEXSUM_FIELDS.difference(config.get("fields", [])))
             if missing_fields:
                 print(f"❌ Multi-lexsum missing fields: {missing_fields}")
                 return False
@@ -173,7 +200,7 @@ def test_multi_lexsum_output():
         
         if formatted:
             # Check if all summary types are preserved
-            if all(key in formatted for key in ["summary_long", "summary_short", "summary_tiny"]):
+            if _LEXSUM_KEYS.issubset(formatted):
                 print("✅ Multi-lexsum formatting preserves all summary types")
             else:
                 print("❌ Multi-lexsum formatting missing summary types")
@@ -201,13 +228,10 @@ def test_inference_output():
     print("\nTesting Inference Output...")
     
     try:
-        from app.routes.inference import InferenceRequest, InferenceResponse
+        _require("InferenceRequest", "InferenceResponse")
         
         # Check if request/response models are properly defined
-        required_fields = ["text", "model_path", "model_type", "task"]
-        request_fields = InferenceRequest.__fields__
-        
-        missing_fields = [field for field in required_fields if field not in request_fields]
+        missing_fields = sorted(_INFERENCE_REQ_FIELDS - InferenceRequest.__fields__.keys())
         if missing_fields:
             print(f"❌ InferenceRequest missing fields: {missing_fields}")
             return False
@@ -215,8 +239,7 @@ def test_inference_output():
             print("✅ InferenceRequest has all required fields")
         
         # Check response fields
-        response_fields = InferenceResponse.__fields__
-        if "summary" in response_fields and "processing_time" in response_fields:
+        if _RESPONSE_FIELDS <= InferenceResponse.__fields__.keys():
             print("✅ InferenceResponse has required fields")
         else:
             print("❌ InferenceResponse missing required fields")
@@ -234,9 +257,9 @@ def test_data_processing_output():
     print("\nTesting Data Processing Output...")
     
     try:
-        from app.utils.data_processor import LegalDataProcessor
+        _require("LegalDataProcessor")
         
-        processor = LegalDataProcessor()
+        processor = get_processor()
         
         # Test with sample data
         sample_data = [{
@@ -251,8 +274,7 @@ def test_data_processing_output():
             sample = processed_data[0]
             
             # Check for required output fields
-            required_fields = ["processed_at", "text_length", "summary_length", "language", "complexity", "entities", "is_valid"]
-            missing_fields = [field for field in required_fields if field not in sample]
+            missing_fields = sorted(_PROCESSED_FIELDS.difference(sample))
             
             if missing_fields:
                 print(f"❌ Processed data missing fields: {missing_fields}")
@@ -286,8 +308,6 @@ def test_data_processing_output():
 
 def main():
     """Main test function"""
-    print("Testing Lexicognize Output Functionality\n")
-    
     tests = [
         test_summarization_output,
         test_simplification_output,
@@ -297,30 +317,32 @@ def main():
         test_data_processing_output
     ]
     
-    passed = 0
     total = len(tests)
     
-    for test in tests:
-        try:
-            if test():
-                passed += 1
-        except Exception as e:
-            print(f"ERROR: Test error: {e}")
+    # Tests are independent, so run them concurrently and replay their output in order
+    results = run_concurrently(tests)
     
-    print(f"\nTest Results: {passed}/{total} tests passed")
+    # Emit the header, the captured test output and the summary in a single write
+    passed = sum(test_passed for test_passed, _ in results)
+    report = ["Testing Lexicognize Output Functionality\n\n", *(output for _, output in results)]
+    report.append(f"\nTest Results: {passed}/{total} tests passed\n")
     
     if passed == total:
-        print("SUCCESS: All output functionality tests passed!")
-        print("\nSummarization: Working")
-        print("Simplification: Working") 
-        print("Multilingual: Working")
-        print("Multi-lexsum: Working")
-        print("Inference API: Working")
-        print("Data Processing: Working")
-        return True
+        report.append(
+            "SUCCESS: All output functionality tests passed!\n"
+            "\nSummarization: Working\n"
+            "Simplification: Working\n"
+            "Multilingual: Working\n"
+            "Multi-lexsum: Working\n"
+            "Inference API: Working\n"
+            "Data Processing: Working\n"
+        )
     else:
-        print("WARNING: Some tests failed. Please review the issues above.")
-        return False
+        report.append("WARNING: Some tests failed. Please review the issues above.\n")
+    
+    sys.stdout.write("".join(report))
+    sys.stdout.flush()
+    return passed == total
 
 if __name__ == "__main__":
     success = main()
@@ -1,22 +1,33 @@
 #!/usr/bin/env python3
 """
 Test script to verify multi_lexsum dataset integration and model training pipeline
+
+Run with `python -O test_pipeline.py` to load optimized bytecode. Set
+PIPELINE_COMPILE_BACKEND=1 to precompile backend/app so later runs skip compilation.
 """
 
 import sys
 import os
+import shutil
+import compileall
+import gc
 sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
 
 from app.utils.huggingface_importer import HuggingFaceDatasetImporter
-from app.utils.data_processor import LegalDataProcessor
 from app.models.bart_trainer import BARTTrainer
-import json
+import orjson
 import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from _test_helpers import get_processor
 
-# Setup logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# The imported sample is only read back once, so keep it in tmpfs when available
+SAMPLE_PATH = os.path.join(
+    "/dev/shm" if os.path.isdir("/dev/shm") else ".", "test_multi_lexsum.json"
+)
+
 def test_multi_lexsum_import():
     """Test importing multi_lexsum dataset"""
     logger.info("Testing multi_lexsum dataset import...")
@@ -24,47 +35,49 @@ def test_multi_lexsum_import():
     try:
         # Test dataset info
         info = HuggingFaceDatasetImporter.get_dataset_info("multi_lexsum")
-        logger.info(f"Dataset info: {info}")
+        logger.info("Dataset info: %s", info)
         
         # Test small import
         result = HuggingFaceDatasetImporter.import_dataset(
             dataset_id="multi_lexsum",
             split="validation[:10]",  # Just 10 samples for testing
             sample_size=5,
-            save_path="test_multi_lexsum.json"
+            save_path=SAMPLE_PATH
         )
         
-        logger.info(f"Import result: {result}")
+        logger.info("Import result: %s", result)
         
         if result["status"] == "success":
             # Load and inspect the imported data
-            with open("test_multi_lexsum.json", 'r') as f:
-                data = json.load(f)
+            with open(SAMPLE_PATH, 'rb') as f:
+                data = orjson.loads(f.read())
+            # Parsed into memory, so drop the file (and its tmpfs/page-cache pages) right away
+            os.remove(SAMPLE_PATH)
             
-            logger.info(f"Imported {len(data)} samples")
+            logger.info("Imported %d samples", len(data))
             
             if data:
                 sample = data[0]
-                logger.info(f"Sample keys: {list(sample.keys())}")
-                logger.info(f"Text length: {len(sample.get('text', ''))}")
-                logger.info(f"Summary length: {len(sample.get('summary', ''))}")
-                logger.info(f"Sources count: {sample.get('sources_count', 'N/A')}")
+                logger.info("Sample keys: %s", list(sample))
+                logger.info("Text length: %d", len(sample.get('text', '')))
+                logger.info("Summary length: %d", len(sample.get('summary', '')))
+                logger.info("Sources count: %s", sample.get('sources_count', 'N/A'))
                 
                 # Check if multi_lexsum specific fields are present
                 if 'summary_long' in sample:
-                    logger.info(f"Long summary: {sample['summary_long'][:100]}...")
+                    logger.info("Long summary: %.100s...", sample['summary_long'])
                 if 'summary_short' in sample:
-                    logger.info(f"Short summary: {sample['summary_short'][:100]}...")
+                    logger.info("Short summary: %.100s...", sample['summary_short'])
                 if 'summary_tiny' in sample:
-                    logger.info(f"Tiny summary: {sample['summary_tiny']}")
+                    logger.info("Tiny summary: %s", sample['summary_tiny'])
                 
             return True, data
         else:
-            logger.error(f"Import failed: {result.get('error', 'Unknown error')}")
+            logger.error("Import failed: %s", result.get('error', 'Unknown error'))
             return False, None
             
     except Exception as e:
-        logger.error(f"Error testing multi_lexsum import: {e}")
+        logger.error("Error testing multi_lexsum import: %s", e)
         return False, None
 
 def test_data_processing(data):
@@ -72,7 +85,7 @@ def test_data_processing(data):
     logger.info("Testing data processing...")
     
     try:
-        processor = LegalDataProcessor()
+        processor = get_processor()
         
         # Process the dataset
         processed_data = processor.process_dataset(data)
@@ -80,25 +93,25 @@ def test_data_processing(data):
         # Calculate statistics
         stats = processor.calculate_statistics(processed_data)
         
-        logger.info(f"Processed {len(processed_data)} samples")
-        logger.info(f"Validation rate: {stats.get('validation_rate', 0):.2f}%")
-        logger.info(f"Languages: {stats.get('languages', {})}")
-        logger.info(f"Categories: {stats.get('categories', {})}")
+        logger.info("Processed %d samples", len(processed_data))
+        logger.info("Validation rate: %.2f%%", stats.get('validation_rate', 0))
+        logger.info("Languages: %s", stats.get('languages', {}))
+        logger.info("Categories: %s", stats.get('categories', {}))
         
         if 'text_length_stats' in stats:
             tls = stats['text_length_stats']
-            logger.info(f"Text length - Mean: {tls.get('mean', 0):.1f}, "
-                       f"Min: {tls.get('min', 0)}, Max: {tls.get('max', 0)}")
+            logger.info("Text length - Mean: %.1f, Min: %s, Max: %s",
+                        tls.get('mean', 0), tls.get('min', 0), tls.get('max', 0))
         
         if 'summary_length_stats' in stats:
             sls = stats['summary_length_stats']
-            logger.info(f"Summary length - Mean: {sls.get('mean', 0):.1f}, "
-                       f"Min: {sls.get('min', 0)}, Max: {sls.get('max', 0)}")
+            logger.info("Summary length - Mean: %.1f, Min: %s, Max: %s",
+                        sls.get('mean', 0), sls.get('min', 0), sls.get('max', 0))
         
         return True, processed_data
         
     except Exception as e:
-        logger.error(f"Error in data processing: {e}")
+        logger.error("Error in data processing: %s", e)
         return False, None
 
 def test_bart_trainer(data):
@@ -106,6 +119,8 @@ def test_bart_trainer(data):
     logger.info("Testing BART trainer...")
     
     try:
+        import torch
+        
         # Filter valid samples
         valid_data = [sample for sample in data if sample.get('is_valid', True)]
         
@@ -121,7 +136,7 @@ def test_bart_trainer(data):
         # Prepare data
         train_data, val_data = trainer.prepare_data(test_data, train_ratio=0.75)
         
-        logger.info(f"Training data: {len(train_data)}, Validation data: {len(val_data)}")
+        logger.info("Training data: %d, Validation data: %d", len(train_data), len(val_data))
         
         # Test training (very minimal)
         output_dir = "test_bart_model"
@@ -138,7 +153,7 @@ def test_bart_trainer(data):
             logging_steps=5
         )
         
-        logger.info(f"Training completed. Metrics: {metrics}")
+        logger.info("Training completed. Metrics: %s", metrics)
         
         # Test inference
         if train_data:
@@ -146,62 +161,106 @@ def test_bart_trainer(data):
             summary = trainer.generate_summary(
                 text=test_text,
                 model_path=output_dir,
-                max_length=128
+                max_length=128,
+                use_compile=True,  # Exercise the compiled generation path
+                # Half precision generation; BF16 on Ampere+ avoids FP16 overflow issues
+                autocast_dtype=torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
             )
             
-            logger.info(f"Original text length: {len(test_text)}")
-            logger.info(f"Generated summary: {summary}")
+            logger.info("Original text length: %d", len(test_text))
+            logger.info("Generated summary: %s", summary)
         
         return True
         
     except Exception as e:
-        logger.error(f"Error testing BART trainer: {e}")
+        logger.error("Error testing BART trainer: %s", e)
+        return False
+
+def probe_gpu():
+    """Return True/False for GPU availability, or None when PyTorch is not installed"""
+    # Importing torch is slow; skip it when the machine plainly has no usable NVIDIA GPU
+    if not shutil.which("nvidia-smi") or os.environ.get("CUDA_VISIBLE_DEVICES", "") == "-1":
         return False
+    
+    try:
+        import torch
+    except ImportError:
+        return None
+    return torch.cuda.is_available()
+
+def warm_bytecode():
+    """Precompile the backend package at the current optimization level when requested"""
+    if os.environ.get("PIPELINE_COMPILE_BACKEND") != "1":
+        return
+    
+    backend_app = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'backend', 'app')
+    if not compileall.compile_dir(backend_app, quiet=1, workers=0):
+        logger.warning("Some backend modules failed to compile")
 
 def main():
     """Main test function"""
     logger.info("Starting pipeline test...")
+    warm_bytecode()
     
     # Test 1: Dataset import
-    success, data = test_multi_lexsum_import()
+    # The download is network-bound, so run it in the background while the
+    # processor and the GPU probe initialize on this thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        import_future = executor.submit(test_multi_lexsum_import)
+        try:
+            get_processor()
+        except Exception as e:
+            # Not cached, so test_data_processing retries the construction and reports the failure
+            logger.warning("Could not prepare the data processor early: %s", e)
+        gpu_available = probe_gpu()
+        success, data = import_future.result()
+    
     if not success:
         logger.error("Dataset import test failed. Exiting.")
         return False
     
     # Test 2: Data processing
     success, processed_data = test_data_processing(data)
+    
+    # Only the processed copy is needed from here on; give training the headroom
+    del data
+    get_processor.cache_clear()
+    gc.collect()
+    
     if not success:
         logger.error("Data processing test failed. Exiting.")
         return False
     
     # Test 3: Model training (optional - requires GPU)
-    try:
-        import torch
-        if torch.cuda.is_available():
-            logger.info("GPU available - testing model training...")
-            test_bart_trainer(processed_data)
-        else:
-            logger.info("No GPU available - skipping model training test")
-    except ImportError:
+    if gpu_available is None:
         logger.info("PyTorch not available - skipping model training test")
+    elif gpu_available:
+        logger.info("GPU available - testing model training...")
+        test_bart_trainer(processed_data)
+    else:
+        logger.info("No GPU available - skipping model training test")
+    
+    del processed_data
+    gc.collect()
     
     logger.info("Pipeline test completed successfully!")
     
     # Cleanup
-    test_files = ["test_multi_lexsum.json", "test_bart_model"]
+    test_files = [SAMPLE_PATH, "test_bart_model"]
     for file in test_files:
+        # Try the removal directly instead of stat-ing first
         try:
-            if os.path.exists(file):
-                if os.path.isdir(file):
-                    import shutil
-                    shutil.rmtree(file)
-                else:
-                    os.remove(file)
-        except Exception as e:
-            logger.warning(f"Could not cleanup {file}: {e}")
+            os.remove(file)
+        except IsADirectoryError:
+            shutil.rmtree(file, ignore_errors=True)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Could not cleanup %s: %s", file, e)
     
     return True
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
     success = main()
     sys.exit(0 if success else 1)